@@ -0,0 +1,33 @@
+"""add binary quantized embedding index to document_chunks
+
+Revision ID: b7e4f2a91c3d
+Revises: 7c69cc9f8407
+Create Date: 2026-10-17 10:12:31.204518
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e4f2a91c3d"
+down_revision: Union[str, None] = "7c69cc9f8407"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add HNSW Hamming index over binary-quantized chunk embeddings."""
+    op.execute(
+        """
+        CREATE INDEX idx_chunk_embedding_bq_hamming
+        ON document_chunks
+        USING hnsw ((CAST(binary_quantize(embedding) AS BIT(1024))) bit_hamming_ops)
+    """
+    )
+
+
+def downgrade() -> None:
+    """Remove binary-quantized embedding index from document_chunks table."""
+    op.execute("DROP INDEX IF EXISTS idx_chunk_embedding_bq_hamming")
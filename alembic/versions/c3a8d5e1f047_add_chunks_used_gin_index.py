@@ -0,0 +1,33 @@
+"""add jsonb_path_ops GIN index on solve_requests.chunks_used
+
+Revision ID: c3a8d5e1f047
+Revises: b7e4f2a91c3d
+Create Date: 2026-10-17 11:02:47.913350
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a8d5e1f047"
+down_revision: Union[str, None] = "b7e4f2a91c3d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add GIN index for containment queries on chunks_used."""
+    op.execute(
+        """
+        CREATE INDEX ix_solve_requests_chunks_used_gin
+        ON solve_requests
+        USING gin (chunks_used jsonb_path_ops)
+    """
+    )
+
+
+def downgrade() -> None:
+    """Remove chunks_used GIN index from solve_requests table."""
+    op.execute("DROP INDEX IF EXISTS ix_solve_requests_chunks_used_gin")
@@ -0,0 +1,39 @@
+"""drop redundant single-column indexes on document_chunks
+
+Revision ID: d9f1b6c2e815
+Revises: c3a8d5e1f047
+Create Date: 2026-10-17 11:40:05.338172
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d9f1b6c2e815"
+down_revision: Union[str, None] = "c3a8d5e1f047"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop indexes covered by uq_document_chunks_document_chunk_index."""
+    op.drop_index("ix_document_chunks_chunk_index", table_name="document_chunks")
+    op.drop_index("ix_document_chunks_document_id", table_name="document_chunks")
+
+
+def downgrade() -> None:
+    """Restore single-column indexes on document_chunks."""
+    op.create_index(
+        "ix_document_chunks_document_id",
+        "document_chunks",
+        ["document_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_document_chunks_chunk_index",
+        "document_chunks",
+        ["chunk_index"],
+        unique=False,
+    )
@@ -0,0 +1,77 @@
+"""store document_chunks embeddings as halfvec
+
+Revision ID: e2c7a4b9d160
+Revises: d9f1b6c2e815
+Create Date: 2026-10-17 12:15:52.604917
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2c7a4b9d160"
+down_revision: Union[str, None] = "d9f1b6c2e815"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _drop_embedding_indexes() -> None:
+    """Drop indexes that depend on the embedding column type."""
+    op.execute("DROP INDEX IF EXISTS idx_chunk_embedding_bq_hamming")
+    op.execute("DROP INDEX IF EXISTS idx_chunk_embedding_cosine")
+
+
+def upgrade() -> None:
+    """Convert embeddings to halfvec and rebuild HNSW indexes."""
+    _drop_embedding_indexes()
+    op.execute(
+        """
+        ALTER TABLE document_chunks
+        ALTER COLUMN embedding TYPE halfvec(1024)
+        USING embedding::halfvec(1024)
+    """
+    )
+    op.execute(
+        """
+        CREATE INDEX idx_chunk_embedding_cosine
+        ON document_chunks
+        USING hnsw (embedding halfvec_cosine_ops)
+        WITH (m = 16, ef_construction = 200)
+    """
+    )
+    op.execute(
+        """
+        CREATE INDEX idx_chunk_embedding_bq_hamming
+        ON document_chunks
+        USING hnsw ((CAST(binary_quantize(embedding) AS BIT(1024))) bit_hamming_ops)
+    """
+    )
+
+
+def downgrade() -> None:
+    """Convert embeddings back to vector and rebuild HNSW indexes."""
+    _drop_embedding_indexes()
+    op.execute(
+        """
+        ALTER TABLE document_chunks
+        ALTER COLUMN embedding TYPE vector(1024)
+        USING embedding::vector(1024)
+    """
+    )
+    op.execute(
+        """
+        CREATE INDEX idx_chunk_embedding_cosine
+        ON document_chunks
+        USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 200)
+    """
+    )
+    op.execute(
+        """
+        CREATE INDEX idx_chunk_embedding_bq_hamming
+        ON document_chunks
+        USING hnsw ((CAST(binary_quantize(embedding) AS BIT(1024))) bit_hamming_ops)
+    """
+    )
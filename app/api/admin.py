@@ -2,7 +2,7 @@
 
 import json
 import logging
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, Query, Request, Response, status
 from fastapi.responses import RedirectResponse, StreamingResponse
@@ -55,7 +55,7 @@ async def admin_documents(
 
     # Get documents
     skip = (page - 1) * page_size
-    filters = {}
+    filters: dict[str, Any] = {}
     if status_enum is not None:
         filters["status"] = status_enum
 
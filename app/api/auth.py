@@ -66,7 +66,7 @@ async def authenticate(
 
     settings = get_settings()
 
-    if not hmac.compare_digest(api_key, settings.api_key):
+    if not hmac.compare_digest(api_key.encode(), settings.api_key_bytes):
         logger.warning("Failed login attempt")
         return templates.TemplateResponse(
             request=request,
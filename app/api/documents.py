@@ -1,9 +1,11 @@
 """Documents API endpoints."""
 
 import logging
+from typing import Any, List
 
 from fastapi import APIRouter, Depends, UploadFile
 from fastapi import status as http_status
+from sqlalchemy import Row
 
 from app.exceptions import TaskEnqueueError
 from app.models.document import DocumentStatus
@@ -41,13 +43,13 @@ async def create_document(
     return response
 
 
-@router.get("")
+@router.get("", response_model=list[DocumentResponse])
 async def list_documents(
     status: DocumentStatus | None = None,
     limit: int = 100,
     offset: int = 0,
     service: DocumentService = Depends(dependencies.document),
-) -> list[DocumentResponse]:
+) -> List[Row[Any]]:
     """List documents with optional filters and pagination.
 
     Args:
@@ -57,14 +59,15 @@ async def list_documents(
         service: DocumentService instance.
 
     Returns:
-        List of documents matching the filters.
+        Rows of documents matching the filters, validated once by FastAPI
+        against the response model.
     """
-    filters = {}
+    filters: dict[str, Any] = {}
     if status is not None:
         filters["status"] = status
 
-    documents = await service.find(limit=limit, offset=offset, **filters)
-    return [DocumentResponse.model_validate(doc) for doc in documents]
+    # Rows are only serialized, so skip ORM hydration
+    return await service.find_rows(limit=limit, offset=offset, **filters)
 
 
 @router.get("/{document_id}")
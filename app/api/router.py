@@ -2,14 +2,18 @@
 
 import logging
 
-from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Response, status
+from fastapi.responses import ORJSONResponse
 
 from app.middleware.auth import APIKeyMiddleware
 from app.utils.db import db_manager
 
 logger = logging.getLogger(__name__)
 
+# Liveness payload never changes, so it is serialized once at import
+HEALTH_RESPONSE_BODY = orjson.dumps({"status": "healthy", "service": "euler-rag"})
+
 
 def create_public_router() -> APIRouter:
     """Create router with public endpoints (require cookie auth).
@@ -63,13 +67,13 @@ def create_protected_router() -> APIRouter:
     router = APIRouter(prefix=APIKeyMiddleware.PROTECTED_PREFIX)
 
     @router.get("/health", tags=["Health"], status_code=status.HTTP_200_OK)
-    async def health_check() -> dict:
+    async def health_check() -> Response:
         """Health check endpoint - basic application health.
 
         Returns:
-            Health status response.
+            Health status response with pre-serialized body.
         """
-        return {"status": "healthy", "service": "euler-rag"}
+        return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
     @router.get(
         "/health/db",
@@ -77,7 +81,7 @@ def create_protected_router() -> APIRouter:
         status_code=status.HTTP_200_OK,
         response_model=None,
     )
-    async def health_check_db() -> JSONResponse:
+    async def health_check_db() -> ORJSONResponse:
         """Deep health check - includes database connectivity check.
 
         Returns:
@@ -85,7 +89,7 @@ def create_protected_router() -> APIRouter:
         """
         try:
             is_healthy = await db_manager.verify_connection()
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_200_OK,
                 content={
                     "status": "healthy",
@@ -94,7 +98,7 @@ def create_protected_router() -> APIRouter:
             )
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 content={
                     "status": "unhealthy",
@@ -1,13 +1,12 @@
 """FastAPI application factory with production-ready configuration."""
 
 import logging
-import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Callable
+from typing import AsyncGenerator
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.api.router import (
@@ -16,6 +15,7 @@ from app.api.router import (
     create_public_router,
 )
 from app.config import Settings, get_settings
+from app.middleware.access_log import AccessLogMiddleware
 from app.middleware.auth import APIKeyMiddleware
 from app.middleware.cookie_auth import CookieAuthMiddleware
 from app.services.embedding_service import (
@@ -160,7 +160,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
 
 def _setup_cors(app: FastAPI, settings: Settings) -> None:
-    """Configure CORS middleware based on environment."""
+    """Configure CORS middleware based on environment.
+
+    Skips the middleware entirely outside development when no origins are
+    configured, so same-origin deployments don't pay for it on every request.
+    """
     if settings.is_development:
         app.add_middleware(
             CORSMiddleware,
@@ -172,10 +176,13 @@ def _setup_cors(app: FastAPI, settings: Settings) -> None:
     else:
         origins = settings.cors_origins
         if not origins:
+            # Without allowed origins the middleware can only reject, and
+            # browsers already block cross-origin requests by default
             logger.warning(
                 "CORS origins not configured for production, "
                 "all cross-origin requests will be blocked"
             )
+            return
         app.add_middleware(
             CORSMiddleware,
             allow_origins=origins,
@@ -185,48 +192,16 @@ def _setup_cors(app: FastAPI, settings: Settings) -> None:
         )
 
 
-def _setup_request_middleware(app: FastAPI) -> None:
-    """Configure request processing middleware."""
-
-    @app.middleware("http")
-    async def add_process_time_header(
-        request: Request, call_next: Callable[[Request], Response]
-    ) -> Response:
-        """Add X-Process-Time header to all responses."""
-        start_time = time.time()
-        response = await call_next(request)
-        response.headers["X-Process-Time"] = f"{time.time() - start_time:.4f}"
-        return response
-
-    @app.middleware("http")
-    async def log_requests(
-        request: Request, call_next: Callable[[Request], Response]
-    ) -> Response:
-        """Log incoming requests and responses."""
-        extra = {
-            "method": request.method,
-            "path": request.url.path,
-            "client": request.client.host if request.client else None,
-        }
-        logger.info(f"Request: {request.method} {request.url.path}", extra=extra)
-
-        response = await call_next(request)
-
-        extra["status_code"] = response.status_code
-        logger.info(
-            f"Response: {request.method} {request.url.path} - {response.status_code}",
-            extra=extra,
-        )
-        return response
-
-
 def _setup_openapi(app: FastAPI) -> None:
     """Configure custom OpenAPI schema with API key security."""
+    protected_prefix = APIKeyMiddleware.PROTECTED_PREFIX
 
     def custom_openapi() -> dict:
         if app.openapi_schema:
             return app.openapi_schema
 
+        from fastapi.openapi.utils import get_openapi
+
         schema = get_openapi(
             title=app.title,
             version=app.version,
@@ -243,9 +218,10 @@ def _setup_openapi(app: FastAPI) -> None:
         }
 
         for path, methods in schema["paths"].items():
-            if path.startswith(APIKeyMiddleware.PROTECTED_PREFIX):
+            if path.startswith(protected_prefix):
                 for method in methods.values():
-                    if isinstance(method, dict):
+                    # Operation objects built by get_openapi are plain dicts
+                    if type(method) is dict:
                         method["security"] = [{"APIKeyHeader": []}]
 
         app.openapi_schema = schema
@@ -275,6 +251,7 @@ def create_app() -> FastAPI:
         redoc_url="/redoc" if settings.is_development else None,
         openapi_url="/openapi.json" if settings.is_development else None,
         swagger_ui_parameters={"persistAuthorization": True},
+        default_response_class=ORJSONResponse,
     )
 
     # Setup in order: middleware → exception handlers → routes → openapi
@@ -282,7 +259,7 @@ def create_app() -> FastAPI:
     app.add_middleware(CookieAuthMiddleware)
     app.add_middleware(APIKeyMiddleware)
     _setup_cors(app, settings)
-    _setup_request_middleware(app)
+    app.add_middleware(AccessLogMiddleware)
 
     register_exception_handlers(app)
 
@@ -298,7 +275,9 @@ def create_app() -> FastAPI:
     # Mount protected routes (require API key header) under /api prefix
     app.include_router(create_protected_router())
 
-    _setup_openapi(app)
+    # Schema is only served in development (openapi_url is None otherwise)
+    if app.openapi_url:
+        _setup_openapi(app)
 
     logger.info("FastAPI application created successfully")
     return app
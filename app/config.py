@@ -1,6 +1,6 @@
 """Application configuration using Pydantic Settings."""
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal
 
 from pydantic import Field, field_validator
@@ -11,7 +11,9 @@ class Settings(BaseSettings):
     """Application settings with validation and type safety.
 
     Uses pydantic-settings for automatic environment variable loading
-    with proper type conversion and validation.
+    with proper type conversion and validation. Derived values (connection
+    URLs, environment flags) are computed once on first access; the model is
+    frozen, so assigning to a field raises ValidationError.
     """
 
     model_config = SettingsConfigDict(
@@ -19,6 +21,13 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",  # Ignore extra environment variables
+        # Declared defaults are valid by construction; only values coming from
+        # the environment are validated. api_key and db_password opt back in,
+        # since their empty defaults must be checked.
+        validate_default=False,
+        # Settings are read-only after loading: cached derived values rely on
+        # it, and frozen models skip per-assignment handling entirely.
+        frozen=True,
     )
 
     # API Settings
@@ -37,7 +46,9 @@ class Settings(BaseSettings):
     db_host: str = Field(default="localhost", description="Database host")
     db_port: int = Field(default=5432, ge=1, le=65535, description="Database port")
     db_user: str = Field(default="postgres", description="Database user")
-    db_password: str = Field(default="", description="Database password")
+    db_password: str = Field(
+        default="", description="Database password", validate_default=True
+    )
     db_name: str = Field(default="euler_rag", description="Database name")
 
     # Database connection pool settings
@@ -55,6 +66,11 @@ class Settings(BaseSettings):
         ge=60,
         description="Database connection recycle time in seconds",
     )
+    db_statement_cache_size: int = Field(
+        default=500,
+        ge=0,
+        description="Prepared statements cached per database connection",
+    )
 
     # Logging Settings
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
@@ -66,6 +82,7 @@ class Settings(BaseSettings):
         default="",
         description="API key for authentication",
         min_length=1,
+        validate_default=True,
     )
     cors_origins: list[str] = Field(
         default_factory=list,
@@ -177,7 +194,12 @@ class Settings(BaseSettings):
             raise ValueError("OpenRouter API key must be at least 32 characters")
         return v
 
-    @property
+    @cached_property
+    def api_key_bytes(self) -> bytes:
+        """Encoded API key for constant-time comparison with raw bytes."""
+        return self.api_key.encode()
+
+    @cached_property
     def database_url(self) -> str:
         """Build async PostgreSQL database URL."""
         return (
@@ -185,7 +207,7 @@ class Settings(BaseSettings):
             f"@{self.db_host}:{self.db_port}/{self.db_name}"
         )
 
-    @property
+    @cached_property
     def database_url_sync(self) -> str:
         """Build sync PostgreSQL database URL for Alembic migrations."""
         return (
@@ -193,7 +215,7 @@ class Settings(BaseSettings):
             f"@{self.db_host}:{self.db_port}/{self.db_name}"
         )
 
-    @property
+    @cached_property
     def redis_url(self) -> str:
         """Build Redis connection URL."""
         if self.redis_password:
@@ -203,12 +225,12 @@ class Settings(BaseSettings):
             )
         return f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production environment."""
         return self.environment == "production"
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development environment."""
         return self.environment == "development"
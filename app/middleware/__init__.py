@@ -1,6 +1,7 @@
 """Middleware components for the application."""
 
+from app.middleware.access_log import AccessLogMiddleware
 from app.middleware.auth import APIKeyMiddleware
 from app.middleware.cookie_auth import CookieAuthMiddleware
 
-__all__ = ["APIKeyMiddleware", "CookieAuthMiddleware"]
+__all__ = ["AccessLogMiddleware", "APIKeyMiddleware", "CookieAuthMiddleware"]
@@ -0,0 +1,74 @@
+"""Access logging middleware implemented as a pure ASGI application."""
+
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class AccessLogMiddleware:
+    """Middleware that logs requests and adds X-Process-Time header.
+
+    Implemented as plain ASGI instead of BaseHTTPMiddleware, so the downstream
+    app runs in the same task and response bodies are streamed through
+    untouched. Only the response start message is intercepted.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: Downstream ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Log request, time it and annotate response headers.
+
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        # Checked once per request: when INFO is disabled, neither the extra
+        # dict nor the messages are built
+        log_enabled = logger.isEnabledFor(logging.INFO)
+        if log_enabled:
+            client = scope.get("client")
+            extra = {
+                "method": method,
+                "path": path,
+                "client": client[0] if client else None,
+            }
+            logger.info(f"Request: {method} {path}", extra=extra)
+
+        async def send_wrapper(message: Message) -> None:
+            """Add X-Process-Time to the response start and log the response.
+
+            Args:
+                message: ASGI message sent by the application.
+            """
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "X-Process-Time", f"{time.perf_counter() - start_time:.4f}"
+                )
+                if log_enabled:
+                    status_code = message["status"]
+                    extra["status_code"] = status_code
+                    logger.info(
+                        f"Response: {method} {path} - {status_code}", extra=extra
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
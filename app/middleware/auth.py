@@ -2,28 +2,61 @@
 
 import hmac
 import logging
-from typing import Callable
+from typing import Optional
 
-from fastapi import Request, Response, status
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+import orjson
+from fastapi import status
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config import get_settings
-from app.middleware.cookie_auth import COOKIE_NAME, verify_session_token
+from app.middleware.cookie_auth import (
+    decode_session_token,
+    extract_session_token,
+    session_digest,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class APIKeyMiddleware(BaseHTTPMiddleware):
+class APIKeyMiddleware:
     """Middleware to validate API key for protected endpoints.
 
     All endpoints under /api prefix require X-API-KEY header.
     If request has valid session cookie, automatically injects X-API-KEY header.
     This allows admin panel to make API requests without JavaScript reading cookie.
     Other endpoints (health, docs, root) are public.
+
+    Implemented as plain ASGI to avoid BaseHTTPMiddleware task group and
+    Request construction on every request.
     """
 
     PROTECTED_PREFIX: str = "/api"
+    # Unauthorized payload is constant, serialized once at import
+    UNAUTHORIZED_BODY: bytes = orjson.dumps(
+        {"error": "Unauthorized", "message": "Invalid or missing API key"}
+    )
+    UNAUTHORIZED_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(UNAUTHORIZED_BODY)).encode()),
+    )
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize middleware and cache credentials from settings.
+
+        API key is fixed for the process lifetime, so the key, the header
+        injected for cookie sessions and the expected session digest are
+        computed once.
+
+        Args:
+            app: Downstream ASGI application.
+        """
+        self.app = app
+        # Bound once so the hot path avoids classmethod dispatch
+        self._protected_prefix = self.PROTECTED_PREFIX
+        settings = get_settings()
+        self._api_key_bytes = settings.api_key_bytes
+        self._injected_header = (b"x-api-key", self._api_key_bytes)
+        self._expected_session_digest = session_digest(settings.api_key)
 
     @classmethod
     def is_protected_path(cls, path: str) -> bool:
@@ -37,48 +70,80 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
         """
         return path.startswith(cls.PROTECTED_PREFIX)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and validate API key if required."""
-        if not self.is_protected_path(request.url.path):
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Validate API key for protected paths.
 
-        settings = get_settings()
-
-        # Get API key from header (if already present)
-        api_key = request.headers.get("X-API-KEY") or request.headers.get("x-api-key")
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
+        """
+        if scope["type"] != "http" or not scope["path"].startswith(
+            self._protected_prefix
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # Single pass over raw headers (names are lowercase bytes in ASGI),
+        # remembering the cookie header in case API key is absent. The key is
+        # kept as raw bytes and compared against the encoded setting.
+        api_key: Optional[bytes] = None
+        cookie_header = b""
+        for name, value in scope["headers"]:
+            if name == b"x-api-key":
+                if api_key is None:
+                    api_key = value
+            elif name == b"cookie" and not cookie_header:
+                cookie_header = value
 
         # If no API key in header, check for valid session cookie
         if not api_key:
-            session_token = request.cookies.get(COOKIE_NAME)
-            if session_token and verify_session_token(session_token, settings.api_key):
-                # Valid session - automatically inject API key header
-                # Add header to scope (headers are lowercase in Starlette)
-                api_key_bytes = settings.api_key.encode()
-                request.scope["headers"].append((b"x-api-key", api_key_bytes))
-                # Also update request.headers for downstream handlers
-                # Note: request.headers is read-only, but we've added to scope
-                api_key = settings.api_key
-                logger.debug(
-                    "Auto-injected API key from session cookie",
-                    extra={"path": request.url.path},
-                )
+            token_digest = decode_session_token(extract_session_token(cookie_header))
+            if token_digest is not None and hmac.compare_digest(
+                token_digest, self._expected_session_digest
+            ):
+                # Valid session - automatically inject API key header.
+                # Downstream gets a copied scope, the server's one is untouched
+                scope = {**scope, "headers": [*scope["headers"], self._injected_header]}
+                api_key = self._api_key_bytes
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Auto-injected API key from session cookie",
+                        extra={"path": scope["path"]},
+                    )
 
         # Validate API key
-        if not api_key or not hmac.compare_digest(api_key, settings.api_key):
-            logger.warning(
-                "Unauthorized request",
-                extra={
-                    "path": request.url.path,
-                    "method": request.method,
-                    "has_key": bool(api_key),
-                },
-            )
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={
-                    "error": "Unauthorized",
-                    "message": "Invalid or missing API key",
-                },
-            )
-
-        return await call_next(request)
+        if not api_key or not hmac.compare_digest(api_key, self._api_key_bytes):
+            # Skip building the extra dict when the record would be dropped
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Unauthorized request",
+                    extra={
+                        "path": scope["path"],
+                        "method": scope["method"],
+                        "has_key": bool(api_key),
+                    },
+                )
+            await self._send_unauthorized(send)
+            return
+
+        await self.app(scope, receive, send)
+
+    async def _send_unauthorized(self, send: Send) -> None:
+        """Send precomputed 401 response.
+
+        Headers are copied into a fresh list per response: outer middleware
+        may append to it (e.g. X-Process-Time), so a shared Response instance
+        would accumulate headers across requests.
+
+        Args:
+            send: ASGI send callable.
+        """
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_401_UNAUTHORIZED,
+                "headers": list(self.UNAUTHORIZED_HEADERS),
+            }
+        )
+        await send({"type": "http.response.body", "body": self.UNAUTHORIZED_BODY})
@@ -1,14 +1,15 @@
 """Cookie-based authentication middleware for browser access to public routes."""
 
+import binascii
 import hashlib
 import hmac
 import logging
-from typing import Callable
+from functools import lru_cache
+from typing import Optional, cast
 from urllib.parse import quote
 
-from fastapi import Request, Response, status
-from fastapi.responses import RedirectResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import status
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config import get_settings
 
@@ -17,19 +18,55 @@ logger = logging.getLogger(__name__)
 COOKIE_NAME = "euler_session"
 SESSION_MESSAGE = "euler_rag_session_valid"
 
+_COOKIE_PREFIX = f"{COOKIE_NAME}=".encode()
+_SESSION_MESSAGE_BYTES = SESSION_MESSAGE.encode()
+_SESSION_DIGEST_SIZE = 32
+
+
+def session_digest(api_key: str) -> bytes:
+    """Compute raw session digest using keyed BLAKE2b.
+
+    BLAKE2b's keyed mode is a MAC on its own, so it replaces the two-pass
+    HMAC construction. Keys longer than the 64-byte BLAKE2b limit are
+    hashed first, as HMAC does, so such keys still yield distinct tokens.
+
+    Args:
+        api_key: The API key to use as secret.
+
+    Returns:
+        32-byte digest.
+    """
+    key = api_key.encode()
+    if len(key) > hashlib.blake2b.MAX_KEY_SIZE:
+        key = hashlib.blake2b(key).digest()
+    return hashlib.blake2b(
+        _SESSION_MESSAGE_BYTES, key=key, digest_size=_SESSION_DIGEST_SIZE
+    ).digest()
+
 
 def generate_session_token(api_key: str) -> str:
-    """Generate a session token using HMAC.
+    """Generate a session token for the session cookie.
 
     Args:
         api_key: The API key to use as secret.
 
     Returns:
-        Hex-encoded HMAC digest.
+        Hex-encoded session digest.
     """
-    return hmac.new(
-        api_key.encode(), SESSION_MESSAGE.encode(), hashlib.sha256
-    ).hexdigest()
+    return session_digest(api_key).hex()
+
+
+@lru_cache(maxsize=1)
+def _cached_session_token(api_key: str) -> str:
+    """Return session token for API key, computed once per key.
+
+    Args:
+        api_key: The API key to use as secret.
+
+    Returns:
+        Hex-encoded session token.
+    """
+    return generate_session_token(api_key)
 
 
 def verify_session_token(token: str, api_key: str) -> bool:
@@ -42,22 +79,105 @@ def verify_session_token(token: str, api_key: str) -> bool:
     Returns:
         True if token is valid, False otherwise.
     """
-    expected = generate_session_token(api_key)
-    return hmac.compare_digest(token, expected)
+    return hmac.compare_digest(token, _cached_session_token(api_key))
+
+
+def extract_session_token(cookie_header: bytes) -> Optional[bytes]:
+    """Extract session token from raw Cookie header value.
+
+    Scans for the session cookie directly instead of parsing every cookie
+    in the header into a dict.
+
+    Args:
+        cookie_header: Raw Cookie header value.
+
+    Returns:
+        Session token bytes, or None if the cookie is absent.
+    """
+    start = 0
+    while True:
+        index = cookie_header.find(_COOKIE_PREFIX, start)
+        if index == -1:
+            return None
+        # Require a cookie boundary, so "xeuler_session=" does not match
+        if index == 0 or cookie_header[index - 1] in b"; ":
+            break
+        start = index + 1
+
+    value_start = index + len(_COOKIE_PREFIX)
+    value_end = cookie_header.find(b";", value_start)
+    if value_end == -1:
+        value_end = len(cookie_header)
+    return cookie_header[value_start:value_end].strip()
+
+
+def decode_session_token(token: Optional[bytes]) -> Optional[bytes]:
+    """Decode hex session token from the cookie into raw digest bytes.
 
+    Tokens stay hex on the wire; comparing the raw digest halves the bytes
+    passed through the constant-time compare.
 
-class CookieAuthMiddleware(BaseHTTPMiddleware):
+    Args:
+        token: Hex-encoded token bytes, or None if the cookie is absent.
+
+    Returns:
+        Raw digest bytes, or None if the token is absent or not valid hex.
+    """
+    if not token:
+        return None
+    try:
+        return binascii.unhexlify(token)
+    except binascii.Error:
+        return None
+
+
+def find_cookie_header(scope: Scope) -> bytes:
+    """Return raw Cookie header value from ASGI scope.
+
+    Args:
+        scope: ASGI connection scope.
+
+    Returns:
+        First Cookie header value, or empty bytes if absent.
+    """
+    for name, value in scope["headers"]:
+        if name == b"cookie":
+            return cast(bytes, value)
+    return b""
+
+
+class CookieAuthMiddleware:
     """Middleware for cookie-based authentication on protected browser routes.
 
     Only paths explicitly listed in PROTECTED_PATHS or matching PROTECTED_PREFIXES
     require a valid session cookie. If no valid cookie is present, redirects to login.
+    Implemented as plain ASGI so public paths pass through without overhead.
     """
 
     # Paths that require cookie authentication (whitelist)
-    PROTECTED_PATHS: set[str] = {"/docs", "/redoc", "/openapi.json"}
+    PROTECTED_PATHS: frozenset[str] = frozenset({"/docs", "/redoc", "/openapi.json"})
     # Path prefixes that require cookie authentication
     PROTECTED_PREFIXES: tuple[str, ...] = ("/admin",)
 
+    LOGIN_REDIRECT_PREFIX: str = "/login?next="
+    # Redirect targets depend on the session, so they must not be cached
+    REDIRECT_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+        (b"cache-control", b"no-store"),
+        (b"content-length", b"0"),
+    )
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize middleware and cache the expected session digest.
+
+        Args:
+            app: Downstream ASGI application.
+        """
+        self.app = app
+        # Bound once so the hot path avoids classmethod dispatch
+        self._protected_paths = frozenset(self.PROTECTED_PATHS)
+        self._protected_prefixes = tuple(self.PROTECTED_PREFIXES)
+        self._expected_session_digest = session_digest(get_settings().api_key)
+
     @classmethod
     def requires_cookie_auth(cls, path: str) -> bool:
         """Check if path requires cookie authentication.
@@ -72,37 +192,67 @@ class CookieAuthMiddleware(BaseHTTPMiddleware):
             return True
         return path.startswith(cls.PROTECTED_PREFIXES)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and validate session cookie for protected paths.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Validate session cookie for protected paths.
 
-        Args:
-            request: Incoming HTTP request.
-            call_next: Next middleware/handler in chain.
+        Redirects to login if the cookie is missing or invalid.
 
-        Returns:
-            Response from handler or redirect to login if unauthorized.
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
         """
-        path = request.url.path
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Only require authentication for explicitly protected paths
-        if not self.requires_cookie_auth(path):
-            return await call_next(request)
+        # Only require authentication for explicitly protected paths. Match the
+        # decoded path: raw_path keeps percent-encoding ("/doc%73") and would
+        # let encoded variants bypass the allowlist.
+        path = scope["path"]
+        if path not in self._protected_paths and not path.startswith(
+            self._protected_prefixes
+        ):
+            await self.app(scope, receive, send)
+            return
 
-        settings = get_settings()
-        session_token = request.cookies.get(COOKIE_NAME)
+        session_token = extract_session_token(find_cookie_header(scope))
+        token_digest = decode_session_token(session_token)
 
-        if not session_token or not verify_session_token(
-            session_token, settings.api_key
+        if token_digest is None or not hmac.compare_digest(
+            token_digest, self._expected_session_digest
         ):
-            logger.warning(
-                "Unauthorized browser access",
-                extra={
-                    "path": path,
-                    "method": request.method,
-                    "has_cookie": bool(session_token),
-                },
-            )
-            redirect_url = f"/login?next={quote(path, safe='')}"
-            return RedirectResponse(url=redirect_url, status_code=status.HTTP_302_FOUND)
-
-        return await call_next(request)
+            # Skip building the extra dict when the record would be dropped
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Unauthorized browser access",
+                    extra={
+                        "path": path,
+                        "method": scope["method"],
+                        "has_cookie": bool(session_token),
+                    },
+                )
+            await self._send_login_redirect(path, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    async def _send_login_redirect(self, path: str, send: Send) -> None:
+        """Send redirect to login page, preserving the requested path.
+
+        Only the Location header varies per request, so the response is sent
+        as raw ASGI messages with the remaining headers precomputed.
+
+        Args:
+            path: Requested path, passed to login as the next parameter.
+            send: ASGI send callable.
+        """
+        location = (self.LOGIN_REDIRECT_PREFIX + quote(path, safe="")).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_302_FOUND,
+                "headers": [(b"location", location), *self.REDIRECT_HEADERS],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
@@ -1,7 +1,8 @@
 """Base model class with timestamp tracking."""
 
 from datetime import datetime
-from typing import Any, Dict
+from operator import attrgetter
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, Tuple
 
 from sqlalchemy import DateTime, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column
@@ -27,6 +28,10 @@ class BaseModel(Base):
 
     __abstract__ = True  # This is an abstract base class
 
+    # Fetch server-generated values (timestamps) via RETURNING during flush,
+    # so created and updated instances need no follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     # Primary key - all models will have an id column
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -41,21 +46,76 @@ class BaseModel(Base):
         nullable=False,
     )
 
+    # Column names cached per mapped class, see __init_subclass__
+    _column_names: ClassVar[Tuple[str, ...]] = ()
+    _repr_column_names: ClassVar[Tuple[str, ...]] = ()
+    # Typed as attrgetter, not Callable: mypy binds Callable class
+    # attributes as methods when called through an instance
+    _column_getter: ClassVar["attrgetter[Tuple[Any, ...]]"]
+    _mapped_keys: ClassVar[Optional[FrozenSet[str]]] = None
+    _column_keys: ClassVar[Optional[FrozenSet[str]]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Cache column names once the subclass is mapped.
+
+        Declarative mapping runs in the base __init_subclass__, so __table__
+        is available afterwards for concrete models.
+        """
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "__table__"):
+            cls._column_names = tuple(column.name for column in cls.__table__.columns)
+            cls._repr_column_names = tuple(
+                name for name in cls._column_names if name != "id"
+            )
+            # attrgetter returns a bare value for a single name; repeating it
+            # keeps a tuple result and zip in to_dict drops the duplicate
+            getter_names = cls._column_names
+            if len(getter_names) == 1:
+                getter_names *= 2
+            cls._column_getter = attrgetter(*getter_names)
+
+    @classmethod
+    def mapped_keys(cls) -> FrozenSet[str]:
+        """Return mapped attribute names accepted for filters and updates.
+
+        Computed on first use rather than in __init_subclass__, since
+        relationships can only be resolved once all models are mapped.
+
+        Returns:
+            Column and relationship attribute names.
+        """
+        keys = cls.__dict__.get("_mapped_keys")
+        if keys is None:
+            keys = frozenset(cls.__mapper__.attrs.keys())
+            cls._mapped_keys = keys
+        return keys
+
+    @classmethod
+    def column_keys(cls) -> FrozenSet[str]:
+        """Return mapped column attribute names, without relationships.
+
+        Cached on first use like mapped_keys.
+
+        Returns:
+            Column attribute names.
+        """
+        keys = cls.__dict__.get("_column_keys")
+        if keys is None:
+            keys = frozenset(cls.__mapper__.column_attrs.keys())
+            cls._column_keys = keys
+        return keys
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert model instance to dictionary.
 
         Returns:
             Dictionary representation of the model
         """
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
+        return dict(zip(self._column_names, self._column_getter(self)))
 
     def __repr__(self) -> str:
         """String representation of the model."""
         attrs = ", ".join(
-            f"{key}={repr(value)}"
-            for key, value in self.to_dict().items()
-            if key != "id"
+            f"{name}={getattr(self, name)!r}" for name in self._repr_column_names
         )
         return f"{self.__class__.__name__}(id={self.id}, {attrs})"
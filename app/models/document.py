@@ -69,8 +69,9 @@ class Document(BaseModel):
         index=True,
         default=DocumentStatus.UPLOADED,
     )
+    # Factory, so each row gets its own dict instead of sharing one instance
     progress: Mapped[Dict[str, Any]] = mapped_column(
-        JSONB, nullable=False, default={"page": 0, "total": 0}
+        JSONB, nullable=False, default=lambda: {"page": 0, "total": 0}
     )
 
     # Error tracking
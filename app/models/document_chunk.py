@@ -7,12 +7,14 @@ if TYPE_CHECKING:
     from app.models.document import Document
     from app.models.document_line import DocumentLine
 
-from sqlalchemy import ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
-from app.utils.vector_types import Vector
+from app.utils.vector_types import HalfVector, binary_quantize
+
+EMBEDDING_DIMENSIONS = 1024
 
 
 class DocumentChunk(BaseModel):
@@ -56,11 +58,23 @@ class DocumentChunk(BaseModel):
 
     __tablename__ = "document_chunks"
     __table_args__ = (
+        # The unique index on (document_id, chunk_index) also serves lookups
+        # by document_id and ordered scans of a document's chunks, so neither
+        # column has an index of its own
         UniqueConstraint(
             "document_id",
             "chunk_index",
             name="uq_document_chunks_document_chunk_index",
         ),
+        # HNSW graph index for cosine similarity search, so top-k retrieval
+        # avoids a sequential scan. Matches migration e2c7a4b9d160.
+        Index(
+            "idx_chunk_embedding_cosine",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+            postgresql_with={"m": 16, "ef_construction": 200},
+        ),
     )
 
     # Foreign key to document
@@ -68,12 +82,11 @@ class DocumentChunk(BaseModel):
         Integer,
         ForeignKey("documents.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Content
     text: Mapped[str] = mapped_column(Text, nullable=False)
-    chunk_index: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
 
     # Source tracking
     start_page: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -97,31 +110,51 @@ class DocumentChunk(BaseModel):
     )
     token_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
-    # Vector embedding for RAG
+    # Vector embedding for RAG, stored as float16 (2 KB instead of 4 KB)
     embedding: Mapped[Optional[list[float]]] = mapped_column(
-        Vector(1024), nullable=True
+        HalfVector(EMBEDDING_DIMENSIONS), nullable=True
     )
 
-    # Relationships (lazy='noload' for optimized queries)
+    # Relationships; never lazy-loaded with SQL (async sessions cannot),
+    # load explicitly via BaseService.get_by_id_with_relations
     document: Mapped["Document"] = relationship(
-        "Document", lazy="noload", foreign_keys=[document_id]
+        "Document", lazy="raise_on_sql", foreign_keys=[document_id]
     )
     start_line: Mapped[Optional["DocumentLine"]] = relationship(
         "DocumentLine",
-        lazy="noload",
+        lazy="raise_on_sql",
         foreign_keys=[start_line_id],
     )
     end_line: Mapped[Optional["DocumentLine"]] = relationship(
         "DocumentLine",
-        lazy="noload",
+        lazy="raise_on_sql",
         foreign_keys=[end_line_id],
     )
 
     def __repr__(self) -> str:
         """String representation of the document chunk."""
+        # Loaded state only, see DocumentLine.__repr__
+        state = self.__dict__
+        text = state.get("text") or ""
         return (
-            f"DocumentChunk(id={self.id}, document_id={self.document_id}, "
-            f"chunk_index={self.chunk_index}, type={self.chunk_type!r}, "
-            f"pages={self.start_page}-{self.end_page}, "
-            f"text={self.text[:50]!r}...)"
+            f"DocumentChunk(id={state.get('id')}, "
+            f"document_id={state.get('document_id')}, "
+            f"chunk_index={state.get('chunk_index')}, "
+            f"type={state.get('chunk_type')!r}, "
+            f"pages={state.get('start_page')}-{state.get('end_page')}, "
+            f"text={text[:50]!r}...)"
         )
+
+
+# HNSW index over binary-quantized embeddings (Hamming distance). 1024 bits
+# per row instead of 2 KB of floats, used for candidate search before
+# rescoring with full vectors. Declared after the class because the
+# expression references the mapped column. Matches migration e2c7a4b9d160.
+Index(
+    "idx_chunk_embedding_bq_hamming",
+    binary_quantize(DocumentChunk.embedding, EMBEDDING_DIMENSIONS).label(
+        "embedding_bq"
+    ),
+    postgresql_using="hnsw",
+    postgresql_ops={"embedding_bq": "bit_hamming_ops"},
+)
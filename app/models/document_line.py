@@ -94,15 +94,21 @@ class DocumentLine(BaseModel):
     region: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
     raw_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
 
-    # Relationship to document (lazy='noload' for optimized queries)
+    # Relationship to document; never lazy-loaded with SQL (async sessions
+    # cannot), load explicitly via BaseService.get_by_id_with_relations
     document: Mapped["Document"] = relationship(
-        "Document", lazy="noload", foreign_keys=[document_id]
+        "Document", lazy="raise_on_sql", foreign_keys=[document_id]
     )
 
     def __repr__(self) -> str:
         """String representation of the document line."""
+        # Read loaded state directly: skips the instrumented descriptors and
+        # never refreshes expired attributes, which fails outside the session
+        state = self.__dict__
+        text = state.get("text") or ""
         return (
-            f"DocumentLine(id={self.id}, document_id={self.document_id}, "
-            f"page={self.page_number}, line={self.line_number}, "
-            f"type={self.line_type!r}, text={self.text[:50]!r}...)"
+            f"DocumentLine(id={state.get('id')}, "
+            f"document_id={state.get('document_id')}, "
+            f"page={state.get('page_number')}, line={state.get('line_number')}, "
+            f"type={state.get('line_type')!r}, text={text[:50]!r}...)"
         )
@@ -4,7 +4,7 @@ import enum
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import Boolean, DateTime, Enum, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, Index, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -56,6 +56,16 @@ class SolveRequest(BaseModel):
     """
 
     __tablename__ = "solve_requests"
+    __table_args__ = (
+        # jsonb_path_ops supports only containment (@>), which is how
+        # chunks_used is queried, at about half the size of default jsonb_ops
+        Index(
+            "ix_solve_requests_chunks_used_gin",
+            "chunks_used",
+            postgresql_using="gin",
+            postgresql_ops={"chunks_used": "jsonb_path_ops"},
+        ),
+    )
 
     # Request content
     question: Mapped[str] = mapped_column(Text, nullable=False)
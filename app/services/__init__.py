@@ -1,11 +1,13 @@
 """Business logic services package."""
 
 from app.services.base import BaseService
+from app.services.document_chunk_service import DocumentChunkService
 from app.services.document_service import DocumentService
 from app.services.solve_request_service import SolveRequestService
 
 __all__ = [
     "BaseService",
+    "DocumentChunkService",
     "DocumentService",
     "SolveRequestService",
 ]
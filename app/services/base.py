@@ -1,11 +1,41 @@
 """Base service class with transaction management for database operations."""
 
+import functools
 import logging
-from typing import Any, Generic, List, Optional, TypeVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Generic,
+    List,
+    Literal,
+    NoReturn,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
-from sqlalchemy import func, select
-from sqlalchemy.exc import DBAPIError, IntegrityError, SQLAlchemyError
+from sqlalchemy import (
+    Insert,
+    Row,
+    Select,
+    Update,
+    bindparam,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    select,
+    update,
+)
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.base import ExecutableOption
 
 from app.exceptions import (
     DatabaseConnectionError,
@@ -17,6 +47,152 @@ from app.models.base import BaseModel
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+_INTEGRITY_ERROR_PREFIX = "Integrity constraint violation: "
+
+# Keyword arguments of read methods that are not column filters
+_NON_FILTER_ARGUMENTS = frozenset({"limit", "offset", "loads"})
+
+# Filter shape: (attribute name, value is None) pairs in keyword order. Not
+# sorted: a call site passes keywords in a fixed order, so each site maps to
+# one key and other orders just add a cache entry
+FilterKey = Tuple[Tuple[str, bool], ...]
+
+
+@functools.lru_cache(maxsize=512)
+def _filter_statement(
+    model: type[BaseModel],
+    filter_key: FilterKey,
+    *,
+    count: bool = False,
+    limit: bool = False,
+    offset: bool = False,
+) -> Optional[Select[Any]]:
+    """Build a filtered SELECT once per model and filter shape.
+
+    Filter values are bound at execution under their attribute names, with
+    _limit and _offset for pagination, so calls differing only in values
+    reuse one statement. None values compile to IS NULL, as in filter_by.
+
+    Args:
+        model: Model class to select from.
+        filter_key: Filter shape, see FilterKey.
+        count: Select the row count instead of model instances.
+        limit: Add a bound LIMIT.
+        offset: Add a bound OFFSET.
+
+    Returns:
+        Statement, or None if a filter is a relationship, which needs the
+        related instance to build its criteria.
+    """
+    relationships = model.__mapper__.relationships
+    if any(name in relationships for name, _ in filter_key):
+        return None
+    query = select(func.count(model.id)) if count else select(model)
+    query = query.where(
+        *(
+            (
+                getattr(model, name).is_(None)
+                if is_none
+                else getattr(model, name) == bindparam(name)
+            )
+            for name, is_none in filter_key
+        )
+    )
+    if offset:
+        query = query.offset(bindparam("_offset"))
+    if limit:
+        query = query.limit(bindparam("_limit"))
+    return query
+
+
+def db_operation(
+    operation: str,
+    *,
+    rollback: bool = False,
+    context: Optional[Literal["id", "filters"]] = None,
+) -> Callable[[F], F]:
+    """Wrap a BaseService method with shared database error handling.
+
+    SQLAlchemy errors are logged and re-raised as DatabaseConnectionError.
+    Write operations roll back the session on any failure, including
+    RecordNotFoundError and InvalidFilterError, which propagate unchanged.
+
+    Args:
+        operation: Operation name used in log and error messages.
+        rollback: Roll back the session when the operation fails.
+        context: Call arguments to add to the error log: "id" logs the
+            record_id argument, "filters" logs the keyword filters.
+
+    Returns:
+        Decorator for async service methods.
+    """
+
+    # Message parts depend only on the operation, build them once per method
+    error_prefix = f"Database error during {operation}: "
+    log_message = f"Database error during {operation} on %s"
+
+    async def fail(
+        service: "BaseService[Any]",
+        e: SQLAlchemyError,
+        prefix: str,
+        args: Tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> NoReturn:
+        """Roll back if needed, log the failure and raise it as app error.
+
+        Args:
+            service: Service whose method failed.
+            e: Original SQLAlchemy error.
+            prefix: Start of the DatabaseConnectionError message.
+            args: Positional arguments of the failed call.
+            kwargs: Keyword arguments of the failed call.
+
+        Raises:
+            DatabaseConnectionError: Always, chained to the original error.
+        """
+        if rollback:
+            await service.db.rollback()
+        # str() of SQLAlchemy errors renders statement and parameters,
+        # so it is computed once for both the log and the exception
+        error = str(e)
+        # Skip building the record and formatting the traceback when
+        # error logging is disabled
+        if logger.isEnabledFor(logging.ERROR):
+            extra: dict[str, Any] = {
+                "model": service._model_name,
+                "operation": operation,
+                "error": error,
+            }
+            if context == "id":
+                extra["id"] = args[0] if args else kwargs.get("record_id")
+            elif context == "filters":
+                extra["filters"] = {
+                    key: value
+                    for key, value in kwargs.items()
+                    if key not in _NON_FILTER_ARGUMENTS
+                }
+            logger.error(log_message, service._model_name, extra=extra, exc_info=True)
+        raise DatabaseConnectionError(prefix + error) from e
+
+    def decorator(method: F) -> F:
+        @functools.wraps(method)
+        async def wrapper(self: "BaseService[Any]", *args: Any, **kwargs: Any) -> Any:
+            try:
+                return await method(self, *args, **kwargs)
+            except (RecordNotFoundError, InvalidFilterError):
+                if rollback:
+                    await self.db.rollback()
+                raise
+            except IntegrityError as e:
+                await fail(self, e, _INTEGRITY_ERROR_PREFIX, args, kwargs)
+            except SQLAlchemyError as e:
+                await fail(self, e, error_prefix, args, kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
 
 
 class BaseService(Generic[T]):
@@ -25,7 +201,8 @@ class BaseService(Generic[T]):
     Provides database operations with transaction management:
     - Write operations (create, update, delete) flush changes but rely on
       dependency's commit (e.g., get_db_session) for transaction commit
-    - Read operations (get_by_id, get_all, find, count) don't commit
+    - Read operations (get_by_id, get_all, iter_all, find, find_rows, count,
+      exists) don't commit
     - All errors trigger automatic rollback
 
     Usage:
@@ -45,9 +222,29 @@ class BaseService(Generic[T]):
     Attributes:
         db: Database session for operations
         model: Model class this service manages
+        default_load_options: Loader options applied by get_by_id, get_all
+            and find, e.g. selectinload for relationships almost always read
     """
 
     model: type[T]
+    default_load_options: ClassVar[Tuple[ExecutableOption, ...]] = ()
+
+    # Statements fixed by the model, built once per service class
+    _insert_returning: ClassVar[Insert]
+    _update_by_pk: ClassVar[Update]
+    # Model name for logs and error messages
+    _model_name: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build model-specific statement skeletons once the model is set."""
+        super().__init_subclass__(**kwargs)
+        model = cls.__dict__.get("model")
+        if model is not None:
+            cls._model_name = model.__name__
+            cls._insert_returning = insert(model).returning(
+                model, sort_by_parameter_order=True
+            )
+            cls._update_by_pk = update(model)
 
     def __init__(self, db: AsyncSession) -> None:
         """Initialize service with database session.
@@ -57,13 +254,95 @@ class BaseService(Generic[T]):
         """
         self.db = db
 
-    async def create(self, **kwargs: Any) -> T:
+    def _validate_filters(self, filters: dict[str, Any]) -> None:
+        """Check filter keys against the model's mapped attributes.
+
+        Args:
+            filters: Field-value pairs to filter by.
+
+        Raises:
+            InvalidFilterError: If a key is not a mapped attribute.
+        """
+        invalid = filters.keys() - self.model.mapped_keys()
+        if invalid:
+            key = min(invalid)
+            raise InvalidFilterError(
+                f"Invalid filter key '{key}' for model {self._model_name}"
+            )
+
+    def _load_options(
+        self, loads: Sequence[ExecutableOption]
+    ) -> Tuple[ExecutableOption, ...]:
+        """Combine the service's default loader options with per-call ones.
+
+        Args:
+            loads: Loader options passed to a read method.
+
+        Returns:
+            Options to apply to the query, empty if there are none.
+        """
+        if not loads:
+            return self.default_load_options
+        return (*self.default_load_options, *loads)
+
+    def _filter_query(
+        self,
+        filters: dict[str, Any],
+        *,
+        count: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Tuple[Select[Any], dict[str, Any]]:
+        """Get filtered statement and its parameters for find and count.
+
+        Args:
+            filters: Field-value pairs to filter by.
+            count: Select the row count instead of model instances.
+            limit: Maximum number of records to return.
+            offset: Number of records to skip.
+
+        Returns:
+            Statement and execution parameters.
+
+        Raises:
+            InvalidFilterError: If a key is not a mapped attribute.
+        """
+        self._validate_filters(filters)
+        filter_key = tuple((k, v is None) for k, v in filters.items())
+        query = _filter_statement(
+            self.model,
+            filter_key,
+            count=count,
+            limit=bool(limit),
+            offset=bool(offset),
+        )
+        if query is None:
+            # Relationship filters are built per call by filter_by
+            query = select(func.count(self.model.id)) if count else select(self.model)
+            query = query.filter_by(**filters)
+            if offset:
+                query = query.offset(offset)
+            if limit:
+                query = query.limit(limit)
+            return query, {}
+
+        params = {k: v for k, v in filters.items() if v is not None}
+        if offset:
+            params["_offset"] = offset
+        if limit:
+            params["_limit"] = limit
+        return query, params
+
+    @db_operation("create", rollback=True)
+    async def create(self, *, refresh: bool = False, **kwargs: Any) -> T:
         """Create a new record.
 
         Flushes changes to database but relies on dependency's commit
-        for transaction commit (e.g., get_db_session dependency).
+        for transaction commit (e.g., get_db_session dependency). Server
+        defaults are populated by the flush itself (eager_defaults).
 
         Args:
+            refresh: Reload the instance from the database after flush
             **kwargs: Model attributes
 
         Returns:
@@ -73,38 +352,63 @@ class BaseService(Generic[T]):
             DatabaseConnectionError: If database operation fails
             IntegrityError: If unique constraint is violated
         """
-        try:
-            instance = self.model(**kwargs)
-            self.db.add(instance)
-            await self.db.flush()
+        instance = self.model(**kwargs)
+        self.db.add(instance)
+        await self.db.flush()
+        if refresh:
             await self.db.refresh(instance)
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Created {self.model.__name__}",
-                extra={"model": self.model.__name__, "id": instance.id},
+                "Created %s",
+                self._model_name,
+                extra={"model": self._model_name, "id": instance.id},
             )
-            return instance
-        except (IntegrityError, DBAPIError, SQLAlchemyError) as e:
-            await self.db.rollback()
-            logger.error(
-                f"Failed to create {self.model.__name__}",
-                extra={"model": self.model.__name__, "error": str(e)},
-                exc_info=True,
+        return instance
+
+    @db_operation("create_many", rollback=True)
+    async def create_many(self, rows: List[dict[str, Any]]) -> List[T]:
+        """Create multiple records in a single INSERT ... RETURNING statement.
+
+        Uses ORM bulk insert, so per-instance construction (__init__) and
+        session add hooks are bypassed; rows must contain column values only.
+        Returned instances are attached to the session. Relies on dependency's
+        commit for transaction commit.
+
+        Args:
+            rows: Column-value mappings, one per record
+
+        Returns:
+            Created model instances in input order
+
+        Raises:
+            DatabaseConnectionError: If database operation fails
+        """
+        if not rows:
+            return []
+        result = await self.db.scalars(self._insert_returning, rows)
+        instances = cast(List[T], result.all())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Created %d %s records",
+                len(instances),
+                self._model_name,
+                extra={"model": self._model_name, "count": len(instances)},
             )
-            if isinstance(e, IntegrityError):
-                raise DatabaseConnectionError(
-                    f"Integrity constraint violation: {str(e)}"
-                ) from e
-            raise DatabaseConnectionError(
-                f"Database error during create: {str(e)}"
-            ) from e
+        return instances
 
-    async def get_by_id(self, record_id: int) -> Optional[T]:
+    @db_operation("get", context="id")
+    async def get_by_id(
+        self, record_id: int, *, loads: Sequence[ExecutableOption] = ()
+    ) -> Optional[T]:
         """Retrieve a record by its primary key ID.
 
-        This is a read operation and does not commit the transaction.
+        Without loader options, records already loaded in the session are
+        returned without a query. This is a read operation and does not
+        commit the transaction.
 
         Args:
             record_id: Primary key ID
+            loads: Loader options, e.g. selectinload(Model.relationship)
 
         Returns:
             Model instance or None if not found
@@ -112,18 +416,43 @@ class BaseService(Generic[T]):
         Raises:
             DatabaseConnectionError: If database operation fails
         """
-        try:
+        options = self._load_options(loads)
+        if options:
+            # session.get skips options on an identity map hit, so relations
+            # would stay unloaded; a SELECT loads them onto the instance
             result = await self.db.execute(
-                select(self.model).where(self.model.id == record_id)
+                select(self.model).options(*options).where(self.model.id == record_id)
             )
             return result.scalar_one_or_none()
-        except (DBAPIError, SQLAlchemyError) as e:
-            logger.error(
-                f"Failed to get {self.model.__name__} by id",
-                extra={"model": self.model.__name__, "id": record_id, "error": str(e)},
-                exc_info=True,
-            )
-            raise DatabaseConnectionError(f"Database error during get: {str(e)}") from e
+        # Identity map first; on a miss the session runs its cached
+        # primary key lookup
+        return await self.db.get(self.model, record_id)
+
+    @db_operation("get", context="id")
+    async def get_by_id_with_relations(self, record_id: int) -> Optional[T]:
+        """Retrieve a record by ID with all its relationships loaded.
+
+        Relationships are not lazy-loaded in async sessions, so they are
+        fetched up front with one SELECT ... IN query per relationship.
+        Use get_by_id when related records are not needed.
+
+        Args:
+            record_id: Primary key ID
+
+        Returns:
+            Model instance with relationships loaded, or None if not found
+
+        Raises:
+            DatabaseConnectionError: If database operation fails
+        """
+        options = [
+            selectinload(relationship.class_attribute)
+            for relationship in self.model.__mapper__.relationships
+        ]
+        result = await self.db.execute(
+            select(self.model).options(*options).where(self.model.id == record_id)
+        )
+        return result.scalar_one_or_none()
 
     async def get_by_id_or_fail(self, record_id: int) -> T:
         """Retrieve a record by ID or raise exception if not found.
@@ -142,11 +471,16 @@ class BaseService(Generic[T]):
         """
         record = await self.get_by_id(record_id)
         if record is None:
-            raise RecordNotFoundError(self.model.__name__, record_id)
+            raise RecordNotFoundError(self._model_name, record_id)
         return record
 
+    @db_operation("get_all")
     async def get_all(
-        self, limit: Optional[int] = None, offset: Optional[int] = None
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        *,
+        loads: Sequence[ExecutableOption] = (),
     ) -> List[T]:
         """Retrieve all records with optional pagination.
 
@@ -155,6 +489,7 @@ class BaseService(Generic[T]):
         Args:
             limit: Maximum number of records to return
             offset: Number of records to skip
+            loads: Loader options, e.g. selectinload(Model.relationship)
 
         Returns:
             List of model instances
@@ -162,28 +497,79 @@ class BaseService(Generic[T]):
         Raises:
             DatabaseConnectionError: If database operation fails
         """
-        try:
-            query = select(self.model)
-            if offset:
-                query = query.offset(offset)
-            if limit:
-                query = query.limit(limit)
-            result = await self.db.execute(query)
-            return list(result.scalars().all())
-        except (DBAPIError, SQLAlchemyError) as e:
-            logger.error(
-                f"Failed to get all {self.model.__name__}",
-                extra={"model": self.model.__name__, "error": str(e)},
-                exc_info=True,
+        model = self.model
+        options = self._load_options(loads)
+        query = lambda_stmt(lambda: select(model))
+        if options:
+            # Options are part of the cache key rather than bound values
+            query = query.add_criteria(
+                lambda q: q.options(*options), track_on=[options]
             )
+        if offset:
+            query = query.add_criteria(lambda q: q.offset(offset))
+        if limit:
+            query = query.add_criteria(lambda q: q.limit(limit))
+        result = await self.db.execute(query)
+        return cast(List[T], result.scalars().all())
+
+    async def iter_all(
+        self,
+        batch_size: int = 1000,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> AsyncIterator[T]:
+        """Stream records using a server-side cursor.
+
+        Rows are fetched and hydrated in batches, so memory stays bounded by
+        batch_size rather than table size. Use instead of get_all for full
+        table scans or large pages. This is a read operation and does not
+        commit the transaction.
+
+        Args:
+            batch_size: Number of rows fetched per round trip
+            limit: Maximum number of records to yield
+            offset: Number of records to skip
+
+        Yields:
+            Model instances
+
+        Raises:
+            DatabaseConnectionError: If database operation fails
+        """
+        query = select(self.model).execution_options(yield_per=batch_size)
+        if offset:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+        try:
+            result = await self.db.stream_scalars(query)
+            async for record in result:
+                yield record
+        except SQLAlchemyError as e:
+            # Async generators cannot use db_operation, which awaits the call
+            error = str(e)
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    "Database error during iter_all on %s",
+                    self._model_name,
+                    extra={
+                        "model": self._model_name,
+                        "operation": "iter_all",
+                        "error": error,
+                    },
+                    exc_info=True,
+                )
             raise DatabaseConnectionError(
-                f"Database error during get_all: {str(e)}"
+                f"Database error during iter_all: {error}"
             ) from e
 
+    @db_operation("find", context="filters")
     async def find(
         self,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        *,
+        loads: Sequence[ExecutableOption] = (),
         **filters: Any,
     ) -> List[T]:
         """Find records matching the given filters with optional pagination.
@@ -193,6 +579,9 @@ class BaseService(Generic[T]):
         Args:
             limit: Maximum number of records to return.
             offset: Number of records to skip.
+            loads: Loader options, e.g. selectinload(Model.relationship).
+                The name is reserved, so a column called loads cannot be
+                used as a filter here.
             **filters: Field-value pairs to filter by.
 
         Returns:
@@ -202,36 +591,72 @@ class BaseService(Generic[T]):
             InvalidFilterError: If invalid filter key provided.
             DatabaseConnectionError: If database operation fails.
         """
-        try:
-            query = select(self.model)
-            for key, value in filters.items():
-                if not hasattr(self.model, key):
-                    raise InvalidFilterError(
-                        f"Invalid filter key '{key}' for model {self.model.__name__}"
-                    )
-                query = query.where(getattr(self.model, key) == value)
-            if offset:
-                query = query.offset(offset)
-            if limit:
-                query = query.limit(limit)
-            result = await self.db.execute(query)
-            return list(result.scalars().all())
-        except InvalidFilterError:
-            raise
-        except (DBAPIError, SQLAlchemyError) as e:
-            logger.error(
-                f"Failed to find {self.model.__name__}",
-                extra={
-                    "model": self.model.__name__,
-                    "filters": filters,
-                    "error": str(e),
-                },
-                exc_info=True,
-            )
-            raise DatabaseConnectionError(
-                f"Database error during find: {str(e)}"
-            ) from e
+        query, params = self._filter_query(filters, limit=limit, offset=offset)
+        options = self._load_options(loads)
+        if options:
+            query = query.options(*options)
+        result = await self.db.execute(query, params)
+        return cast(List[T], result.scalars().all())
+
+    @db_operation("find_rows", context="filters")
+    async def find_rows(
+        self,
+        *columns: str,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        **filters: Any,
+    ) -> List[Row[Any]]:
+        """Find matching rows as plain Core rows instead of model instances.
 
+        Skips ORM hydration and identity map bookkeeping, so it suits
+        read-only results that are only serialized. Rows support attribute
+        access by column name. This is a read operation and does not commit
+        the transaction.
+
+        Args:
+            *columns: Column names to select, all columns if omitted.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
+            **filters: Column-value pairs to filter by.
+
+        Returns:
+            List of matching rows.
+
+        Raises:
+            InvalidFilterError: If a column or filter key is not a column of
+                the model.
+            DatabaseConnectionError: If database operation fails.
+        """
+        invalid = (columns | filters.keys()) - self.model.column_keys()
+        if invalid:
+            key = min(invalid)
+            raise InvalidFilterError(
+                f"Invalid column '{key}' for model {self._model_name}"
+            )
+        table_columns = self.model.__table__.c
+        selected = (
+            [table_columns[name] for name in columns]
+            if columns
+            else list(table_columns)
+        )
+        query = select(*selected).where(
+            *(
+                (
+                    table_columns[name].is_(None)
+                    if value is None
+                    else table_columns[name] == value
+                )
+                for name, value in filters.items()
+            )
+        )
+        if offset:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+        result = await self.db.execute(query)
+        return cast(List[Row[Any]], result.all())
+
+    @db_operation("count", context="filters")
     async def count(self, **filters: Any) -> int:
         """Count records matching the given filters.
 
@@ -247,37 +672,40 @@ class BaseService(Generic[T]):
             InvalidFilterError: If invalid filter key provided
             DatabaseConnectionError: If database operation fails
         """
-        try:
-            query = select(func.count(self.model.id))
-            for key, value in filters.items():
-                if not hasattr(self.model, key):
-                    raise InvalidFilterError(
-                        f"Invalid filter key '{key}' for model {self.model.__name__}"
-                    )
-                query = query.where(getattr(self.model, key) == value)
-            result = await self.db.execute(query)
-            return result.scalar_one()
-        except InvalidFilterError:
-            raise
-        except (DBAPIError, SQLAlchemyError) as e:
-            logger.error(
-                f"Failed to count {self.model.__name__}",
-                extra={
-                    "model": self.model.__name__,
-                    "filters": filters,
-                    "error": str(e),
-                },
-                exc_info=True,
-            )
-            raise DatabaseConnectionError(
-                f"Database error during count: {str(e)}"
-            ) from e
+        query, params = self._filter_query(filters, count=True)
+        result = await self.db.execute(query, params)
+        return int(result.scalar_one())
+
+    @db_operation("exists", context="filters")
+    async def exists(self, **filters: Any) -> bool:
+        """Check whether any record matches the given filters.
+
+        Prefer over count() > 0: the database stops at the first matching
+        row instead of counting all of them. This is a read operation and
+        does not commit the transaction.
+
+        Args:
+            **filters: Field-value pairs to filter by
+
+        Returns:
+            True if at least one record matches
 
+        Raises:
+            InvalidFilterError: If invalid filter key provided
+            DatabaseConnectionError: If database operation fails
+        """
+        query, params = self._filter_query(filters)
+        result = await self.db.execute(select(query.exists()), params)
+        return bool(result.scalar_one())
+
+    @db_operation("update", rollback=True, context="id")
     async def update(self, record_id: int, **kwargs: Any) -> T:
         """Update a record.
 
-        Flushes changes to database but relies on dependency's commit
-        for transaction commit (e.g., get_db_session dependency).
+        Column updates are issued as one UPDATE ... RETURNING statement
+        without loading the record first. Relationship updates load the
+        record and flush. Relies on dependency's commit for transaction
+        commit (e.g., get_db_session dependency).
 
         Args:
             record_id: Primary key ID of record to update
@@ -291,48 +719,85 @@ class BaseService(Generic[T]):
             InvalidFilterError: If invalid attribute provided
             DatabaseConnectionError: If database operation fails
         """
-        try:
+        invalid = kwargs.keys() - self.model.mapped_keys()
+        if invalid:
+            raise InvalidFilterError(
+                f"Invalid attribute '{min(invalid)}' for model {self._model_name}"
+            )
+        if not kwargs or not kwargs.keys() <= self.model.column_keys():
+            # Relationships are assigned through the loaded instance
             record = await self.get_by_id_or_fail(record_id)
             for key, value in kwargs.items():
-                if not hasattr(record, key):
-                    raise InvalidFilterError(
-                        f"Invalid attribute '{key}' for model {self.model.__name__}"
-                    )
                 setattr(record, key, value)
             await self.db.flush()
-            await self.db.refresh(record)
+        else:
+            # Single UPDATE ... RETURNING; populate_existing refreshes an
+            # instance already in the session, including server onupdate values
+            updated: Optional[T] = await self.db.scalar(
+                update(self.model)
+                .where(self.model.id == record_id)
+                .values(**kwargs)
+                .returning(self.model),
+                execution_options={"populate_existing": True},
+            )
+            if updated is None:
+                raise RecordNotFoundError(self._model_name, record_id)
+            record = updated
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Updated {self.model.__name__}",
-                extra={"model": self.model.__name__, "id": record_id},
+                "Updated %s",
+                self._model_name,
+                extra={"model": self._model_name, "id": record_id},
             )
-            return record
-        except (RecordNotFoundError, InvalidFilterError):
-            await self.db.rollback()
-            raise
-        except (IntegrityError, DBAPIError, SQLAlchemyError) as e:
-            await self.db.rollback()
-            logger.error(
-                f"Failed to update {self.model.__name__}",
-                extra={
-                    "model": self.model.__name__,
-                    "id": record_id,
-                    "error": str(e),
-                },
-                exc_info=True,
+        return record
+
+    @db_operation("update_many", rollback=True)
+    async def update_many(self, rows: List[dict[str, Any]]) -> None:
+        """Update multiple records by primary key in one executemany.
+
+        Each row holds the record "id" and the attributes to set; rows are
+        sent as a single UPDATE ... WHERE id = :id batch. Instances already
+        loaded in the session are not synchronized. Relies on dependency's
+        commit for transaction commit.
+
+        Args:
+            rows: Column-value mappings, each including "id"
+
+        Raises:
+            InvalidFilterError: If a row lacks "id" or has an invalid attribute
+            DatabaseConnectionError: If database operation fails
+        """
+        if not rows:
+            return
+        column_keys = self.model.column_keys()
+        for row in rows:
+            if "id" not in row:
+                raise InvalidFilterError(
+                    f"Missing 'id' in update row for model {self._model_name}"
+                )
+            invalid = row.keys() - column_keys
+            if invalid:
+                raise InvalidFilterError(
+                    f"Invalid attribute '{min(invalid)}' for model "
+                    f"{self._model_name}"
+                )
+        await self.db.execute(self._update_by_pk, rows)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Updated %d %s records",
+                len(rows),
+                self._model_name,
+                extra={"model": self._model_name, "count": len(rows)},
             )
-            if isinstance(e, IntegrityError):
-                raise DatabaseConnectionError(
-                    f"Integrity constraint violation: {str(e)}"
-                ) from e
-            raise DatabaseConnectionError(
-                f"Database error during update: {str(e)}"
-            ) from e
 
+    @db_operation("delete", rollback=True, context="id")
     async def delete(self, record_id: int) -> None:
         """Delete a record.
 
-        Flushes changes to database but relies on dependency's commit
-        for transaction commit (e.g., get_db_session dependency).
+        Issues one DELETE ... RETURNING statement without loading the
+        record; dependent rows are removed by ON DELETE CASCADE foreign keys.
+        Relies on dependency's commit for transaction commit (e.g.,
+        get_db_session dependency).
 
         Args:
             record_id: Primary key ID of record to delete
@@ -341,28 +806,16 @@ class BaseService(Generic[T]):
             RecordNotFoundError: If record not found
             DatabaseConnectionError: If database operation fails
         """
-        try:
-            record = await self.get_by_id_or_fail(record_id)
-            await self.db.delete(record)
-            await self.db.flush()
+        deleted_id = await self.db.scalar(
+            delete(self.model)
+            .where(self.model.id == record_id)
+            .returning(self.model.id)
+        )
+        if deleted_id is None:
+            raise RecordNotFoundError(self._model_name, record_id)
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Deleted {self.model.__name__}",
-                extra={"model": self.model.__name__, "id": record_id},
-            )
-        except RecordNotFoundError:
-            await self.db.rollback()
-            raise
-        except (DBAPIError, SQLAlchemyError) as e:
-            await self.db.rollback()
-            logger.error(
-                f"Failed to delete {self.model.__name__}",
-                extra={
-                    "model": self.model.__name__,
-                    "id": record_id,
-                    "error": str(e),
-                },
-                exc_info=True,
+                "Deleted %s",
+                self._model_name,
+                extra={"model": self._model_name, "id": record_id},
             )
-            raise DatabaseConnectionError(
-                f"Database error during delete: {str(e)}"
-            ) from e
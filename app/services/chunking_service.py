@@ -5,6 +5,7 @@ theorem-proof blocks together, and maintains mathematical context integrity.
 """
 
 import re
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -46,6 +47,17 @@ class Block:
     end_page: int
     section_path: str = ""
     latex_environments: List[str] = field(default_factory=list)
+    # Token count of text, filled on first use by ChunkingService._block_tokens
+    token_count: Optional[int] = field(default=None, compare=False)
+
+
+class _SectionHeaderLine:
+    """Minimal DocumentLine stand-in for re-detecting parsed section headers."""
+
+    line_type = "section_header"
+
+    def __init__(self, text: str) -> None:
+        self.text = text
 
 
 class ChunkingService:
@@ -81,14 +93,16 @@ class ChunkingService:
         "task",
         "note",
     }
-    BEGIN_ENV_PATTERN = re.compile(
-        r"\\begin\{(theorem|proof|definition|lemma|corollary|example|remark|"
-        r"proposition|assertion|task|note)\}",
+    # Begin and end tags in one pattern, so lines without either are
+    # rejected by a single scan
+    ENV_PATTERN = re.compile(
+        r"\\(?P<tag>begin|end)\{(?P<env>theorem|proof|definition|lemma|corollary|"
+        r"example|remark|proposition|assertion|task|note)\}",
         re.IGNORECASE,
     )
-    END_ENV_PATTERN = re.compile(
-        r"\\end\{(theorem|proof|definition|lemma|corollary|example|remark|"
-        r"proposition|assertion|task|note)\}",
+    BEGIN_ENV_PATTERN = re.compile(
+        r"\\begin\{(?P<env>theorem|proof|definition|lemma|corollary|example|"
+        r"remark|proposition|assertion|task|note)\}",
         re.IGNORECASE,
     )
 
@@ -107,6 +121,12 @@ class ChunkingService:
         r"^(?:§\s*\d+[a-z]?\.|\d+\.)\s+([A-ZА-Я].+)$", re.MULTILINE
     )
 
+    # Numbered line ("1. ...") that is not a section header
+    NUMBERED_LINE_PATTERN = re.compile(r"^\d+\.\s+")
+
+    # OCR artifact: page number left alone on a line
+    PAGE_NUMBER_PATTERN = re.compile(r"^\d{1,4}$")
+
     # Russian keyword patterns (for documents without LaTeX environments)
     RUSSIAN_KEYWORDS = {
         BlockType.THEOREM: re.compile(
@@ -146,6 +166,12 @@ class ChunkingService:
         ),
     }
 
+    # Stems shared by every RUSSIAN_KEYWORDS alternative; lines without any
+    # of them cannot match, so one scan skips the per-keyword searches
+    RUSSIAN_KEYWORD_HINT = re.compile(
+        r"теор|т-ма|док|д-во|опр|лем|след|сл-|прим|зам|утв|пред|зад", re.IGNORECASE
+    )
+
     def __init__(self) -> None:
         """Initialize ChunkingService with tiktoken encoder."""
         # Use cl100k_base encoding (GPT-4 compatible)
@@ -242,8 +268,7 @@ class ChunkingService:
                 # Check for list items (digit + dot pattern that failed section
                 # criteria). Only check if not in narrative block with content
                 if not in_narrative_block:
-                    list_item_pattern = re.compile(r"^\d+\.\s+")
-                    if list_item_pattern.match(text):
+                    if self.NUMBERED_LINE_PATTERN.match(text):
                         # This is a list item
                         if current_block_lines:
                             blocks.append(
@@ -270,17 +295,24 @@ class ChunkingService:
                 and len(current_block_lines) > 0
             ):
                 # Check if it's a numbered line
-                numbered_pattern = re.compile(r"^\d+\.\s+")
-                if numbered_pattern.match(text):
+                if self.NUMBERED_LINE_PATTERN.match(text):
                     # Add to current narrative block, don't create new block
                     current_block_lines.append(line)
                     previous_line = line
                     continue
 
+            # Find the first environment tag; a begin tag anywhere on the
+            # line takes precedence over an end tag
+            begin_match = end_match = self.ENV_PATTERN.search(text)
+            if end_match is not None:
+                if end_match.group("tag").lower() == "begin":
+                    end_match = None
+                else:
+                    begin_match = self.BEGIN_ENV_PATTERN.search(text, end_match.end())
+
             # Check for environment begin
-            begin_match = self.BEGIN_ENV_PATTERN.search(text)
             if begin_match:
-                env_name = begin_match.group(1).lower()
+                env_name = begin_match.group("env").lower()
 
                 # If not in any environment, start a new block
                 if not env_stack:
@@ -308,9 +340,8 @@ class ChunkingService:
                 continue
 
             # Check for environment end
-            end_match = self.END_ENV_PATTERN.search(text)
             if end_match and env_stack:
-                end_env_name = end_match.group(1).lower()
+                end_env_name = end_match.group("env").lower()
                 current_block_lines.append(line)
 
                 # Pop from stack (handle mismatched ends gracefully)
@@ -478,6 +509,8 @@ class ChunkingService:
         Returns:
             BlockType if keyword detected, None otherwise.
         """
+        if not self.RUSSIAN_KEYWORD_HINT.search(text):
+            return None
         for block_type, pattern in self.RUSSIAN_KEYWORDS.items():
             if pattern.search(text):
                 return block_type
@@ -566,8 +599,8 @@ class ChunkingService:
         filtered_lines: List[DocumentLine] = []
         for i, line in enumerate(lines):
             # Skip if first or last line and it's only 1-4 digits
-            if (i == 0 or i == len(lines) - 1) and re.match(
-                r"^\d{1,4}$", line.text.strip()
+            if (i == 0 or i == len(lines) - 1) and self.PAGE_NUMBER_PATTERN.match(
+                line.text.strip()
             ):
                 continue
             filtered_lines.append(line)
@@ -631,7 +664,7 @@ class ChunkingService:
                         break
                     elif candidate.block_type == BlockType.NARRATIVE:
                         # Allow one small narrative gap (e.g., "Рассмотрим...")
-                        if self._count_tokens(candidate.text) < 100:
+                        if self._block_tokens(candidate) < 100:
                             gap_blocks.append(candidate)
                         else:
                             break
@@ -640,11 +673,14 @@ class ChunkingService:
                         break
 
                 if proof_idx is not None:
-                    # Group theorem + gap + proof
-                    combined_text = current.text
-                    for gap in gap_blocks:
-                        combined_text += "\n\n" + gap.text
-                    combined_text += "\n\n" + blocks[proof_idx].text
+                    # Group theorem + gap + proof, copying each text once
+                    combined_text = "\n\n".join(
+                        [
+                            current.text,
+                            *(gap.text for gap in gap_blocks),
+                            blocks[proof_idx].text,
+                        ]
+                    )
 
                     grouped_block = Block(
                         block_type=BlockType.THEOREM_PROOF,
@@ -700,7 +736,7 @@ class ChunkingService:
         current_tokens = 0
 
         for block in blocks:
-            block_tokens = self._count_tokens(block.text)
+            block_tokens = self._block_tokens(block)
 
             # Section headers are strong boundaries - flush and don't merge
             if block.block_type == BlockType.SECTION_HEADER:
@@ -827,22 +863,20 @@ class ChunkingService:
         Returns:
             List of blocks with context headers added.
         """
-        # Track recent definitions (last 3) - cleared on section change
-        recent_definitions: List[Block] = []
+        # Track recent definitions (last 3) - cleared on section change;
+        # the deque drops the oldest one on append
+        recent_definitions: deque[Block] = deque(maxlen=3)
 
         result: List[Block] = []
 
         for block in blocks:
             # Clear definitions on section boundary (prevent context bleeding)
             if block.block_type == BlockType.SECTION_HEADER:
-                recent_definitions = []
+                recent_definitions.clear()
 
             # Track definitions
             if block.block_type == BlockType.DEFINITION:
                 recent_definitions.append(block)
-                # Keep only last 3 definitions
-                if len(recent_definitions) > 3:
-                    recent_definitions.pop(0)
 
             # Add context to theorems/proofs
             if block.block_type in (
@@ -858,7 +892,7 @@ class ChunkingService:
                     context_tokens = 0
 
                     for defn in reversed(recent_definitions):
-                        defn_tokens = self._count_tokens(defn.text)
+                        defn_tokens = self._block_tokens(defn)
                         if (
                             context_tokens + defn_tokens
                             <= self.CONTEXT_HEADER_MAX_TOKENS
@@ -869,12 +903,18 @@ class ChunkingService:
                             break
 
                     if context_parts:
-                        context_header = (
-                            "Context:\n" + "\n\n".join(context_parts) + "\n\n---\n\n"
+                        # Header and block text joined in one copy
+                        text = "".join(
+                            (
+                                "Context:\n",
+                                "\n\n".join(context_parts),
+                                "\n\n---\n\n",
+                                block.text,
+                            )
                         )
                         block = Block(
                             block_type=block.block_type,
-                            text=context_header + block.text,
+                            text=text,
                             start_line_id=block.start_line_id,
                             end_line_id=block.end_line_id,
                             start_page=block.start_page,
@@ -896,22 +936,18 @@ class ChunkingService:
         Returns:
             List of chunk dictionaries.
         """
-        chunks: List[Dict[str, Any]] = []
         # Stack-based section tracking: {level: title}
         section_stack: Dict[int, str] = {}
+        current_section_path = ""
+        section_paths: List[str] = []
 
         for block in blocks:
             # Update section path when we hit section headers
             if block.block_type == BlockType.SECTION_HEADER:
-                # Create a minimal DocumentLine-like object for section detection
                 # For already-parsed section headers, we use lenient detection
-                class MinimalLine:
-                    def __init__(self, text: str):
-                        self.text = text
-                        self.line_type = "section_header"
-
-                minimal_line = MinimalLine(block.text)
-                section_info = self._detect_section_header(minimal_line)
+                section_info = self._detect_section_header(
+                    _SectionHeaderLine(block.text)
+                )
                 if section_info:
                     current_level = section_info["level"]
                     section_title = section_info["title"]
@@ -924,28 +960,51 @@ class ChunkingService:
                     # Add current section to stack
                     section_stack[current_level] = section_title
 
-            # Build section path from stack
-            sorted_titles = [section_stack[k] for k in sorted(section_stack.keys())]
-            current_section_path = " > ".join(sorted_titles)
+                    # Path only changes here, not on every block
+                    current_section_path = " > ".join(
+                        section_stack[k] for k in sorted(section_stack)
+                    )
+
+            section_paths.append(current_section_path)
 
-            chunk = {
+        return [
+            {
                 "text": block.text,
                 "chunk_type": block.block_type.value,
                 "start_page": block.start_page,
                 "end_page": block.end_page,
                 "start_line_id": block.start_line_id,
                 "end_line_id": block.end_line_id,
-                "section_path": current_section_path,
-                "token_count": self._count_tokens(block.text),
+                "section_path": section_path,
+                "token_count": self._block_tokens(block),
             }
-            chunks.append(chunk)
+            for block, section_path in zip(blocks, section_paths)
+        ]
 
-        return chunks
+    def _block_tokens(self, block: Block) -> int:
+        """Count tokens in block text, encoding it at most once per block.
+
+        Blocks pass through grouping, merging, context headers and chunk
+        creation, and unchanged blocks would be re-encoded at each stage.
+        Blocks with new text are new Block objects, so the cached count
+        stays valid.
+
+        Args:
+            block: Block to count tokens for.
+
+        Returns:
+            Token count.
+        """
+        if block.token_count is None:
+            block.token_count = self._count_tokens(block.text)
+        return block.token_count
 
     def _count_tokens(self, text: str) -> int:
         """Count tokens in text using tiktoken.
 
         Uses cl100k_base encoding for GPT-4 compatible token counting.
+        Special token markup is counted as plain text: encode_ordinary skips
+        the extra scan for special tokens, which encode would reject.
 
         Args:
             text: Text to count tokens for.
@@ -956,4 +1015,4 @@ class ChunkingService:
         if not text:
             return 0
 
-        return len(self._encoder.encode(text))
+        return len(self._encoder.encode_ordinary(text))
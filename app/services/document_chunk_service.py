@@ -0,0 +1,91 @@
+"""DocumentChunk service providing similarity search over chunk embeddings.
+
+This service extends BaseService to provide CRUD operations for DocumentChunk
+model and vector retrieval for RAG.
+"""
+
+from typing import Sequence
+
+from sqlalchemy import Float, bindparam, cast, select
+
+from app.models.document_chunk import EMBEDDING_DIMENSIONS, DocumentChunk
+from app.services.base import BaseService, db_operation
+from app.utils.vector_types import HalfVector, binary_quantize
+
+# Candidates fetched by Hamming distance before exact rescoring
+DEFAULT_SEARCH_CANDIDATES = 200
+
+
+class DocumentChunkService(BaseService[DocumentChunk]):
+    """Service for managing DocumentChunk entities.
+
+    Provides CRUD operations through BaseService inheritance plus:
+    - search_similar(embedding, limit): Nearest chunks by cosine distance
+
+    Usage:
+        service = DocumentChunkService(db_session)
+
+        query_embedding = await embedding_service.generate_embedding(question)
+        chunks = await service.search_similar(query_embedding, limit=5)
+
+    Attributes:
+        model: DocumentChunk model class
+        db: Database session for operations
+    """
+
+    model = DocumentChunk
+
+    @db_operation("search")
+    async def search_similar(
+        self,
+        embedding: Sequence[float],
+        limit: int = 10,
+        candidates: int = DEFAULT_SEARCH_CANDIDATES,
+    ) -> Sequence[DocumentChunk]:
+        """Find chunks closest to the query embedding.
+
+        Runs in two stages: the binary-quantized HNSW index selects candidates
+        by Hamming distance, touching 128 bytes per row instead of 2 KB, then
+        the candidates are rescored by exact cosine distance on full vectors.
+
+        This is a read operation and does not commit the transaction.
+
+        Args:
+            embedding: Query embedding with EMBEDDING_DIMENSIONS values
+            limit: Number of chunks to return
+            candidates: Number of Hamming-distance candidates to rescore,
+                raised to limit if smaller
+
+        Returns:
+            Chunks ordered from most to least similar
+
+        Raises:
+            DatabaseConnectionError: If database operation fails
+        """
+        query_vector = cast(
+            bindparam(
+                "query_embedding", list(embedding), HalfVector(EMBEDDING_DIMENSIONS)
+            ),
+            HalfVector(EMBEDDING_DIMENSIONS),
+        )
+        candidate_ids = (
+            select(DocumentChunk.id)
+            .where(DocumentChunk.embedding.is_not(None))
+            .order_by(
+                binary_quantize(DocumentChunk.embedding, EMBEDDING_DIMENSIONS).op(
+                    "<~>", return_type=Float
+                )(binary_quantize(query_vector, EMBEDDING_DIMENSIONS))
+            )
+            .limit(max(candidates, limit))
+            .correlate(None)
+        )
+        query = (
+            select(DocumentChunk)
+            .where(DocumentChunk.id.in_(candidate_ids.scalar_subquery()))
+            .order_by(
+                DocumentChunk.embedding.op("<=>", return_type=Float)(query_vector)
+            )
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return result.scalars().all()
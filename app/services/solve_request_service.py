@@ -1,11 +1,15 @@
 """SolveRequest service for question solving request operations.
 
 This service extends BaseService to provide CRUD operations for SolveRequest
-model. All filtering is handled through inherited find() method.
+model. Column filtering is handled through inherited find() method.
 """
 
+from typing import Any, List, cast
+
+from sqlalchemy import select
+
 from app.models.solve_request import SolveRequest
-from app.services.base import BaseService
+from app.services.base import BaseService, db_operation
 
 
 class SolveRequestService(BaseService[SolveRequest]):
@@ -20,6 +24,7 @@ class SolveRequestService(BaseService[SolveRequest]):
     - count(...): Count requests
     - update(id, **kwargs): Update request
     - delete(id): Delete request
+    - find_by_chunk(chunk_id): Find requests whose answer used a chunk
 
     Usage:
         service = SolveRequestService(db_session)
@@ -50,3 +55,27 @@ class SolveRequestService(BaseService[SolveRequest]):
     """
 
     model = SolveRequest
+
+    @db_operation("find")
+    async def find_by_chunk(self, chunk_id: Any) -> List[SolveRequest]:
+        """Find requests whose chunks_used contains the given chunk.
+
+        Filters with JSONB containment (@>), so the lookup is served by the
+        jsonb_path_ops GIN index instead of scanning every request.
+
+        This is a read operation and does not commit the transaction.
+
+        Args:
+            chunk_id: Value of the chunk_id key in chunks_used entries
+
+        Returns:
+            List of matching solve requests
+
+        Raises:
+            DatabaseConnectionError: If database operation fails
+        """
+        query = select(SolveRequest).where(
+            SolveRequest.chunks_used.contains([{"chunk_id": chunk_id}])
+        )
+        result = await self.db.execute(query)
+        return cast(List[SolveRequest], result.scalars().all())
@@ -1,8 +1,9 @@
 """Database connection utilities with proper dependency injection."""
 
+import asyncio
 import logging
-from collections.abc import AsyncGenerator
-from typing import Optional
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any, Optional
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
@@ -14,6 +15,7 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import get_settings
+from app.utils.vector_types import register_vector_codecs
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +56,12 @@ class DatabaseManager:
             pool_recycle=settings.db_pool_recycle,
             pool_pre_ping=True,  # Verify connections before using
             future=True,  # Use SQLAlchemy 2.0 style
+            connect_args={
+                # Statements are prepared once per connection and reused
+                "prepared_statement_cache_size": settings.db_statement_cache_size,
+            },
         )
+        register_vector_codecs(self._engine)
 
         logger.info(
             "Database engine initialized",
@@ -112,6 +119,34 @@ class DatabaseManager:
             logger.error(f"Database connection verification failed: {e}")
             raise
 
+    async def warm_pool(self, connections: int) -> None:
+        """Open pool connections ahead of the first requests.
+
+        The pool creates connections lazily, so early requests would pay
+        for connecting and codec setup. All connections are checked out at
+        once, so each is a distinct connection, then returned to the pool.
+
+        Args:
+            connections: Number of connections to open, at most pool_size
+                are kept after release.
+
+        Raises:
+            Exception: If a connection cannot be opened.
+        """
+        engine = self.init_engine()
+        results = await asyncio.gather(
+            *(engine.connect().start() for _ in range(connections)),
+            return_exceptions=True,
+        )
+        opened = [r for r in results if not isinstance(r, BaseException)]
+        await asyncio.gather(*(connection.close() for connection in opened))
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        logger.info(
+            "Database connection pool warmed", extra={"connections": len(opened)}
+        )
+
     async def close(self) -> None:
         """Close database engine and clean up connections.
 
@@ -166,10 +201,46 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def parallel_reads(*reads: Callable[[AsyncSession], Awaitable[Any]]) -> list[Any]:
+    """Run independent read queries concurrently on separate sessions.
+
+    A session runs one query at a time, so independent reads awaited in
+    turn pay one round trip each. Each read gets its own session, and
+    connection, from the pool, so their round trips overlap. Sessions are
+    closed without commit; use only for reads.
+
+    Opt-in for reads slow enough to outweigh the cost: each read holds its
+    own pool connection, reads see separate transaction snapshots and may
+    disagree, and sessions come from db_manager rather than the
+    get_db_session dependency, so dependency overrides do not apply.
+    Prefer sequential awaits on the request session for fast queries.
+
+    Usage:
+        report, stats = await parallel_reads(
+            lambda db: ReportService(db).build_report(),
+            lambda db: StatsService(db).aggregate(),
+        )
+
+    Args:
+        *reads: Callables taking a session and returning the read awaitable.
+
+    Returns:
+        Results in the order of reads.
+    """
+    session_factory = db_manager.init_session_factory()
+
+    async def run(read: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        async with session_factory() as session:
+            return await read(session)
+
+    return list(await asyncio.gather(*(run(read) for read in reads)))
+
+
 async def init_db() -> None:
     """Initialize database connection.
 
-    Verifies that database connection works properly.
+    Verifies that database connection works properly and opens the pool's
+    connections up front.
     Does NOT run migrations automatically - migrations should be run
     explicitly via alembic CLI in production.
 
@@ -178,6 +249,7 @@ async def init_db() -> None:
     """
     logger.info("Initializing database connection...")
     await db_manager.verify_connection()
+    await db_manager.warm_pool(get_settings().db_pool_size)
     logger.info("Database initialized successfully")
 
 
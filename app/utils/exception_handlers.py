@@ -2,11 +2,12 @@
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
+import orjson
 from fastapi import FastAPI, Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.exceptions import (
@@ -31,6 +32,7 @@ class ExceptionConfig:
     error_name: str
     log_level: str = "warning"
     include_detail: bool = True
+    message: Optional[str] = None
 
 
 # Exception type to configuration mapping
@@ -52,6 +54,7 @@ EXCEPTION_CONFIGS: dict[type[Exception], ExceptionConfig] = {
         error_name="Service Unavailable",
         log_level="error",
         include_detail=False,
+        message="Database connection error. Please try again later.",
     ),
     ModelError: ExceptionConfig(
         status_code=status.HTTP_400_BAD_REQUEST,
@@ -67,16 +70,33 @@ EXCEPTION_CONFIGS: dict[type[Exception], ExceptionConfig] = {
         error_name="Storage Error",
         log_level="error",
         include_detail=False,
+        message="Failed to process file in storage",
     ),
     TaskEnqueueError: ExceptionConfig(
         status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
         error_name="Service Unavailable",
         log_level="error",
         include_detail=False,
+        message="Failed to schedule background task. Please try again later.",
     ),
 }
 
 
+# Bodies for configs without exception details are constant, render them once
+STATIC_ERROR_BODIES: dict[ExceptionConfig, bytes] = {
+    config: orjson.dumps({"error": config.error_name, "message": config.message})
+    for config in EXCEPTION_CONFIGS.values()
+    if not config.include_detail and config.message is not None
+}
+
+GENERIC_ERROR_BODY = orjson.dumps(
+    {
+        "error": "Internal Server Error",
+        "message": "An unexpected error occurred. Please try again later.",
+    }
+)
+
+
 def _log_exception(exc: Exception, config: ExceptionConfig) -> None:
     """Log exception with appropriate level.
 
@@ -100,15 +120,9 @@ def _build_response_content(exc: Exception, config: ExceptionConfig) -> dict[str
     """
     content: dict[str, Any] = {"error": config.error_name}
 
-    # Add message based on config and exception type
-    if isinstance(exc, DatabaseConnectionError):
-        content["message"] = "Database connection error. Please try again later."
-    elif isinstance(exc, S3OperationError):
-        content["message"] = "Failed to process file in storage"
-    elif isinstance(exc, TaskEnqueueError):
-        content["message"] = (
-            "Failed to schedule background task. Please try again later."
-        )
+    # Add message based on config
+    if config.message is not None:
+        content["message"] = config.message
     elif config.include_detail:
         content["message"] = str(exc)
 
@@ -126,32 +140,54 @@ def _build_response_content(exc: Exception, config: ExceptionConfig) -> dict[str
     return content
 
 
-def _create_handler(
-    config: ExceptionConfig,
-) -> Callable[[Request, Exception], JSONResponse]:
-    """Create exception handler function for given config.
+def _get_config(exc: Exception) -> ExceptionConfig:
+    """Resolve handler configuration for the most specific exception type.
 
     Args:
-        config: Configuration defining status code, error name, and log level.
+        exc: Exception instance raised by a route.
 
     Returns:
-        Async handler function that logs and returns JSON error response.
+        Configuration registered for the closest class in the exception MRO.
     """
+    for exc_type in type(exc).__mro__:
+        config = EXCEPTION_CONFIGS.get(exc_type)
+        if config is not None:
+            return config
+    raise LookupError(f"No exception config for {type(exc).__name__}")
+
+
+async def configured_exception_handler(request: Request, exc: Exception) -> Response:
+    """Handle exceptions listed in EXCEPTION_CONFIGS.
 
-    async def handler(request: Request, exc: Exception) -> JSONResponse:
-        _log_exception(exc, config)
-        content = _build_response_content(exc, config)
-        return JSONResponse(status_code=config.status_code, content=content)
+    Shared by all configured exception types, so handlers are not rebuilt
+    for every application instance.
 
-    return handler
+    Args:
+        request: FastAPI request object.
+        exc: Exception instance to handle.
+
+    Returns:
+        JSON error response with configured status code.
+    """
+    config = _get_config(exc)
+    _log_exception(exc, config)
+    static_body = STATIC_ERROR_BODIES.get(config)
+    if static_body is not None:
+        return Response(
+            content=static_body,
+            status_code=config.status_code,
+            media_type="application/json",
+        )
+    content = _build_response_content(exc, config)
+    return ORJSONResponse(status_code=config.status_code, content=content)
 
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle request validation errors."""
     logger.warning(f"Validation error: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "Validation Error",
@@ -161,15 +197,13 @@ async def validation_exception_handler(
     )
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle all unhandled exceptions."""
     logger.exception(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    return Response(
+        content=GENERIC_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "Internal Server Error",
-            "message": "An unexpected error occurred. Please try again later.",
-        },
+        media_type="application/json",
     )
 
 
@@ -185,7 +219,7 @@ async def not_found_exception_handler(
         exc: HTTP exception.
 
     Returns:
-        TemplateResponse or JSONResponse based on Accept header.
+        TemplateResponse or ORJSONResponse based on Accept header.
     """
     from app.utils.templates import templates
 
@@ -200,7 +234,7 @@ async def not_found_exception_handler(
             status_code=status.HTTP_404_NOT_FOUND,
         )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
         content={
             "error": "Not Found",
@@ -216,8 +250,8 @@ def register_exception_handlers(app: FastAPI) -> None:
         app: FastAPI application instance.
     """
     # Register configured exception handlers
-    for exc_type, config in EXCEPTION_CONFIGS.items():
-        app.add_exception_handler(exc_type, _create_handler(config))
+    for exc_type in EXCEPTION_CONFIGS:
+        app.add_exception_handler(exc_type, configured_exception_handler)
 
     # Register special handlers
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
@@ -1,9 +1,23 @@
-"""SQLAlchemy custom type for PostgreSQL pgvector extension."""
+"""SQLAlchemy custom types for PostgreSQL pgvector extension."""
 
-from typing import List, Optional
+import logging
+import struct
+from typing import Any, Callable, List, Optional, Sequence
 
+from sqlalchemy import cast, event, func
+from sqlalchemy.dialects.postgresql import BIT
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.types import UserDefinedType
 
+from app.exceptions import DatabaseConnectionError
+
+logger = logging.getLogger(__name__)
+
+# pgvector binary format: uint16 dimensions, uint16 unused, then big-endian
+# float32 (vector) or float16 (halfvec) values
+_HEADER = struct.Struct(">HH")
+
 
 class Vector(UserDefinedType):
     """PostgreSQL pgvector type for SQLAlchemy.
@@ -41,8 +55,11 @@ class Vector(UserDefinedType):
             dialect: SQLAlchemy dialect instance.
 
         Returns:
-            Function that converts Python list to pgvector string format.
+            Function that converts Python list to pgvector string format,
+            or None for asyncpg, whose binary codec takes the list as is.
         """
+        if getattr(dialect, "driver", None) == "asyncpg":
+            return None
 
         def process(value: Optional[List[float]]) -> Optional[str]:
             """Convert Python list to pgvector string format.
@@ -67,8 +84,11 @@ class Vector(UserDefinedType):
             coltype: Column type from database.
 
         Returns:
-            Function that converts pgvector string to Python list.
+            Function that converts pgvector string to Python list, or None
+            for asyncpg, whose binary codec already returns a list.
         """
+        if getattr(dialect, "driver", None) == "asyncpg":
+            return None
 
         def process(value: Optional[str]) -> Optional[List[float]]:
             """Convert pgvector string format to Python list.
@@ -85,3 +105,139 @@ class Vector(UserDefinedType):
             return [float(v) for v in value.strip("[]").split(",")]
 
         return process
+
+
+class HalfVector(Vector):
+    """PostgreSQL pgvector halfvec type for SQLAlchemy.
+
+    Stores each dimension as a 16-bit float, halving storage and the memory
+    read per distance computation compared to Vector. Values use the same
+    text format as vector, so conversion is shared.
+
+    Args:
+        dim: Dimensionality of the vector.
+    """
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw) -> str:
+        """Return the column specification for DDL.
+
+        Returns:
+            PostgreSQL halfvec type specification string.
+        """
+        return f"halfvec({self.dim})"
+
+
+def binary_quantize(expression: Any, dim: int) -> ColumnElement[Any]:
+    """Build pgvector binary quantization expression.
+
+    Maps each dimension to one bit (positive -> 1), so a vector becomes
+    dim / 8 bytes. The same expression must be used in the index definition
+    and in queries for PostgreSQL to match the expression index.
+
+    Args:
+        expression: Vector column or bound vector parameter.
+        dim: Dimensionality of the vector.
+
+    Returns:
+        SQL expression of type bit(dim).
+    """
+    return cast(func.binary_quantize(expression), BIT(dim))
+
+
+def _vector_encoder(value_format: str) -> Callable[[Sequence[float]], bytes]:
+    """Build encoder from a sequence of floats to pgvector binary format.
+
+    Args:
+        value_format: struct format character of a single value.
+
+    Returns:
+        Encoder function for asyncpg.
+    """
+
+    def encode(value: Sequence[float]) -> bytes:
+        dim = len(value)
+        return _HEADER.pack(dim, 0) + struct.pack(f">{dim}{value_format}", *value)
+
+    return encode
+
+
+def _vector_decoder(value_format: str) -> Callable[[bytes], List[float]]:
+    """Build decoder from pgvector binary format to a list of floats.
+
+    Args:
+        value_format: struct format character of a single value.
+
+    Returns:
+        Decoder function for asyncpg.
+    """
+
+    def decode(data: bytes) -> List[float]:
+        dim, _ = _HEADER.unpack_from(data)
+        return list(struct.unpack_from(f">{dim}{value_format}", data, _HEADER.size))
+
+    return decode
+
+
+_EXTENSION_SCHEMA_QUERY = (
+    "SELECT n.nspname FROM pg_catalog.pg_extension e "
+    "JOIN pg_catalog.pg_namespace n ON n.oid = e.extnamespace "
+    "WHERE e.extname = 'vector'"
+)
+
+_VECTOR_CODECS = (
+    ("vector", _vector_encoder("f"), _vector_decoder("f")),
+    ("halfvec", _vector_encoder("e"), _vector_decoder("e")),
+)
+
+
+async def set_vector_codecs(connection: Any) -> None:
+    """Register binary pgvector codecs on an asyncpg connection.
+
+    Embeddings then travel as raw floats instead of a text list that the
+    server has to parse, roughly halving payload size for vector. Types are
+    looked up in the schema the extension is installed in.
+
+    Args:
+        connection: asyncpg connection.
+
+    Raises:
+        DatabaseConnectionError: If the pgvector extension or one of its
+            types is missing, since vectors cannot be sent without a codec.
+    """
+    schema = await connection.fetchval(_EXTENSION_SCHEMA_QUERY)
+    if schema is None:
+        raise DatabaseConnectionError(
+            "pgvector extension is not installed, run migrations before connecting"
+        )
+    for type_name, encoder, decoder in _VECTOR_CODECS:
+        try:
+            await connection.set_type_codec(
+                type_name,
+                schema=schema,
+                encoder=encoder,
+                decoder=decoder,
+                format="binary",
+            )
+        except ValueError as e:
+            raise DatabaseConnectionError(
+                f"pgvector type {schema}.{type_name} not found"
+            ) from e
+
+
+def register_vector_codecs(engine: AsyncEngine) -> None:
+    """Set binary pgvector codecs on every new connection of an engine.
+
+    Required for asyncpg engines, since Vector and HalfVector pass values
+    to the driver without converting them to text. Connecting fails if the
+    pgvector extension is not installed yet, so connections are never
+    pooled without the codecs.
+
+    Args:
+        engine: Async engine using the asyncpg driver.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.run_async(set_vector_codecs)
@@ -8,10 +8,11 @@ import asyncio
 import io
 import logging
 from datetime import datetime, timezone
-from typing import Any, List, Optional
+from typing import Any, List, Optional, cast
 
 from pypdf import PdfReader
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.exceptions import MathpixError
@@ -278,19 +279,24 @@ class DocumentHandler(BaseTaskHandler):
                 )
             )
 
-            document_lines = self._convert_mathpix_lines_to_models(
-                document_id, lines_data
-            )
-
-            # Save lines to database in bulk
-            db.add_all(document_lines)
-            await db.flush()
+            line_rows = self._convert_mathpix_lines_to_rows(document_id, lines_data)
+
+            # Save lines with one executemany INSERT, bypassing the unit of
+            # work. Lines left by an earlier committed attempt are skipped,
+            # so reprocessing a document does not fail on the unique key.
+            if line_rows:
+                await db.execute(
+                    insert(DocumentLine).on_conflict_do_nothing(
+                        constraint="uq_document_lines_document_page_line"
+                    ),
+                    line_rows,
+                )
 
             logger.info(
                 "Document lines saved",
                 extra={
                     "document_id": document_id,
-                    "num_lines": len(document_lines),
+                    "num_lines": len(line_rows),
                 },
             )
 
@@ -315,19 +321,19 @@ class DocumentHandler(BaseTaskHandler):
             )
             raise TaskError(f"Mathpix OCR failed: {e}", retryable=e.retryable)
 
-    def _convert_mathpix_lines_to_models(
+    def _convert_mathpix_lines_to_rows(
         self, document_id: int, lines_data: dict[str, Any]
-    ) -> List[DocumentLine]:
-        """Convert Mathpix API response to DocumentLine objects.
+    ) -> List[dict[str, Any]]:
+        """Convert Mathpix API response to DocumentLine column values.
 
         Args:
             document_id: Document ID for the lines.
             lines_data: Mathpix API response with pages and lines.
 
         Returns:
-            List of DocumentLine objects.
+            List of DocumentLine column-value mappings.
         """
-        document_lines: List[DocumentLine] = []
+        line_rows: List[dict[str, Any]] = []
         pages = lines_data.get("pages", [])
 
         for page_data in pages:
@@ -374,22 +380,23 @@ class DocumentHandler(BaseTaskHandler):
                 # Store full line data in raw_metadata for debugging
                 raw_metadata = line_data.copy()
 
-                document_line = DocumentLine(
-                    document_id=document_id,
-                    page_number=page_number,
-                    line_number=line_num,
-                    text=text,
-                    line_type=line_type,
-                    font_size=font_size,
-                    is_printed=is_printed,
-                    is_handwritten=is_handwritten,
-                    confidence=confidence,
-                    region=region,
-                    raw_metadata=raw_metadata,
+                line_rows.append(
+                    {
+                        "document_id": document_id,
+                        "page_number": page_number,
+                        "line_number": line_num,
+                        "text": text,
+                        "line_type": line_type,
+                        "font_size": font_size,
+                        "is_printed": is_printed,
+                        "is_handwritten": is_handwritten,
+                        "confidence": confidence,
+                        "region": region,
+                        "raw_metadata": raw_metadata,
+                    }
                 )
-                document_lines.append(document_line)
 
-        return document_lines
+        return line_rows
 
     async def _chunk_and_save(
         self, document_id: int, total_pages: int, db: AsyncSession
@@ -428,7 +435,7 @@ class DocumentHandler(BaseTaskHandler):
             .where(DocumentLine.document_id == document_id)
             .order_by(DocumentLine.page_number, DocumentLine.line_number)
         )
-        lines = list(result.scalars().all())
+        lines = cast(List[DocumentLine], result.scalars().all())
 
         if not lines:
             logger.warning(
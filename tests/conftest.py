@@ -16,6 +16,7 @@ from app.config import Settings, get_settings
 from app.models.base import BaseModel
 from app.utils.db import Base
 from app.utils.s3 import S3Storage, s3_manager
+from app.utils.vector_types import register_vector_codecs
 
 
 # Test model for integration tests (not prefixed with Test to avoid pytest collection)
@@ -98,17 +99,10 @@ async def db_session(test_settings: Settings) -> AsyncGenerator[AsyncSession, No
         # Enable pgvector extension if not already enabled
         await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
         await conn.run_sync(Base.metadata.create_all)
-        # Create HNSW index for embedding column if not exists
-        await conn.execute(
-            text(
-                """
-                CREATE INDEX IF NOT EXISTS idx_chunk_embedding_cosine
-                ON document_chunks
-                USING hnsw (embedding vector_cosine_ops)
-                WITH (m = 16, ef_construction = 200)
-            """
-            )
-        )
+
+    # Codecs need the extension types, so drop connections opened before it
+    await engine.dispose()
+    register_vector_codecs(engine)
 
     session_factory = async_sessionmaker(
         engine,
@@ -150,17 +144,6 @@ def cleanup_test_database(test_settings: Settings):
             await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
             # Create tables if they don't exist
             await conn.run_sync(Base.metadata.create_all)
-            # Create HNSW index for embedding column if not exists
-            await conn.execute(
-                text(
-                    """
-                    CREATE INDEX IF NOT EXISTS idx_chunk_embedding_cosine
-                    ON document_chunks
-                    USING hnsw (embedding vector_cosine_ops)
-                    WITH (m = 16, ef_construction = 200)
-                """
-                )
-            )
             # Truncate all tables
             for table in reversed(Base.metadata.sorted_tables):
                 await conn.execute(
@@ -211,6 +194,7 @@ def app(test_settings: Settings) -> Generator:
                     mock_result.scalars.return_value.all.return_value = []
                     mock_result.scalar_one_or_none.return_value = None
                     mock_db_session.execute = AsyncMock(return_value=mock_result)
+                    mock_db_session.get = AsyncMock(return_value=None)
 
                     async def override_get_db_session():
                         yield mock_db_session
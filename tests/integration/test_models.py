@@ -150,7 +150,7 @@ class TestPgvectorIntegration:
         assert found is not None
         assert found.embedding is not None
         assert len(found.embedding) == 1024
-        assert found.embedding[0] == 0.1
+        assert found.embedding[0] == pytest.approx(0.1, abs=1e-3)
 
     @pytest.mark.asyncio
     async def test_hnsw_index_exists(self, db_session: AsyncSession):
@@ -176,3 +176,44 @@ class TestUpdateDocumentEnqueueFailure:
                                 )
 
                             app.dependency_overrides.clear()
+
+
+class TestListDocuments:
+    """Tests for document list endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_list_documents_serializes_all_rows(
+        self, settings: Settings, mock_document, mock_updated_document
+    ):
+        """GET /api/documents validates every row into the response."""
+        from datetime import datetime, timezone
+
+        from app.utils.dependencies import dependencies
+
+        timestamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for doc in (mock_document, mock_updated_document):
+            doc.created_at = doc.updated_at = timestamp
+
+        with patch("app.application.init_db", new_callable=AsyncMock):
+            with patch("app.application.close_db", new_callable=AsyncMock):
+                with patch("app.application.init_s3"):
+                    with patch("app.application.close_s3"):
+                        app = create_app()
+
+        mock_service = MagicMock()
+        mock_service.find_rows = AsyncMock(
+            return_value=[mock_document, mock_updated_document]
+        )
+        app.dependency_overrides[dependencies.document] = lambda: mock_service
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(
+                "/api/documents", headers={"X-API-KEY": settings.api_key}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [item["status"] for item in data] == ["uploaded", "pending"]
+        assert data[0]["progress"] == {"page": 0, "total": 0}
+        assert data[0]["url"] is None
@@ -0,0 +1,58 @@
+"""Unit tests for access log middleware."""
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.access_log import AccessLogMiddleware
+
+
+def _create_app() -> FastAPI:
+    """Create minimal app wrapped with AccessLogMiddleware."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> PlainTextResponse:
+        return PlainTextResponse("pong", status_code=201)
+
+    app.add_middleware(AccessLogMiddleware)
+    return app
+
+
+class TestAccessLogMiddleware:
+    """Tests for AccessLogMiddleware behavior."""
+
+    def test_adds_process_time_header(self):
+        """Responses carry X-Process-Time header with elapsed seconds."""
+        client = TestClient(_create_app())
+
+        response = client.get("/ping")
+
+        assert response.status_code == 201
+        assert response.text == "pong"
+        assert float(response.headers["X-Process-Time"]) >= 0
+
+    def test_logs_request_and_response(self, caplog):
+        """Request and response are logged with status code."""
+        client = TestClient(_create_app())
+
+        with caplog.at_level("INFO", logger="app.middleware.access_log"):
+            client.get("/ping")
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert "Request: GET /ping" in messages
+        assert "Response: GET /ping - 201" in messages
+
+    def test_skips_logging_when_info_disabled(self, caplog):
+        """No access records are emitted above INFO, header is still set."""
+        client = TestClient(_create_app())
+
+        with caplog.at_level("WARNING", logger="app.middleware.access_log"):
+            response = client.get("/ping")
+
+        assert "X-Process-Time" in response.headers
+        assert not [
+            record
+            for record in caplog.records
+            if record.name == "app.middleware.access_log"
+        ]
@@ -0,0 +1,112 @@
+"""Unit tests for API key authentication middleware."""
+
+from unittest.mock import patch
+
+from fastapi import FastAPI, Request, status
+from fastapi.testclient import TestClient
+
+from app.middleware.access_log import AccessLogMiddleware
+from app.middleware.auth import APIKeyMiddleware
+from app.middleware.cookie_auth import COOKIE_NAME, generate_session_token
+
+
+def _create_client() -> TestClient:
+    """Create client for minimal app wrapped with APIKeyMiddleware."""
+    app = FastAPI()
+
+    @app.get("/api/echo")
+    async def echo(request: Request) -> dict:
+        return {"api_key": request.headers.get("x-api-key")}
+
+    @app.get("/public")
+    async def public() -> dict:
+        return {"status": "ok"}
+
+    app.add_middleware(APIKeyMiddleware)
+    return TestClient(app)
+
+
+class TestAPIKeyMiddleware:
+    """Tests for APIKeyMiddleware request handling."""
+
+    def test_public_path_does_not_require_key(self, settings):
+        """Paths outside protected prefix pass through."""
+        response = _create_client().get("/public")
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_missing_key_returns_401(self, settings):
+        """Protected path without key returns JSON 401."""
+        response = _create_client().get("/api/echo")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {
+            "error": "Unauthorized",
+            "message": "Invalid or missing API key",
+        }
+
+    def test_repeated_401_does_not_accumulate_headers(self, settings):
+        """Outer middleware headers are not carried over between 401s."""
+        app = FastAPI()
+        app.add_middleware(APIKeyMiddleware)
+        app.add_middleware(AccessLogMiddleware)
+        client = TestClient(app)
+
+        client.get("/api/echo")
+        response = client.get("/api/echo")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert len(response.headers.get_list("x-process-time")) == 1
+
+    def test_invalid_key_returns_401(self, settings):
+        """Protected path with wrong key returns 401."""
+        response = _create_client().get("/api/echo", headers={"X-API-KEY": "wrong"})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_non_ascii_key_returns_401(self, settings):
+        """Non-ASCII key bytes are rejected instead of raising."""
+        response = _create_client().get(
+            "/api/echo", headers={"X-API-KEY": "ключ".encode()}
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_valid_key_reaches_app(self, settings):
+        """Protected path with valid key reaches the app."""
+        response = _create_client().get(
+            "/api/echo", headers={"X-API-KEY": settings.api_key}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"api_key": settings.api_key}
+
+    def test_session_cookie_injects_api_key(self, settings):
+        """Valid session cookie injects API key header for downstream app."""
+        client = _create_client()
+        client.cookies.set(COOKIE_NAME, generate_session_token(settings.api_key))
+
+        response = client.get("/api/echo")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"api_key": settings.api_key}
+
+    def test_invalid_session_cookie_returns_401(self, settings):
+        """Invalid session cookie does not authenticate."""
+        client = _create_client()
+        client.cookies.set(COOKIE_NAME, "forged-token")
+
+        response = client.get("/api/echo")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_settings_read_once_per_middleware(self, settings):
+        """Settings are bound at construction, not looked up per request."""
+        client = _create_client()
+
+        with patch("app.middleware.auth.get_settings", wraps=lambda: settings) as get:
+            for _ in range(3):
+                client.get("/api/echo", headers={"X-API-KEY": settings.api_key})
+
+        assert get.call_count <= 1
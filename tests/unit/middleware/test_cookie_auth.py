@@ -1,10 +1,19 @@
 """Unit tests for cookie-based authentication middleware."""
 
+from unittest.mock import patch
+
+from fastapi import FastAPI, status
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
 from app.middleware.cookie_auth import (
     COOKIE_NAME,
     SESSION_MESSAGE,
     CookieAuthMiddleware,
+    decode_session_token,
+    extract_session_token,
     generate_session_token,
+    session_digest,
     verify_session_token,
 )
 
@@ -19,9 +28,16 @@ class TestSessionToken:
         token = generate_session_token(api_key)
 
         assert isinstance(token, str)
-        assert len(token) == 64  # SHA256 hex digest is 64 chars
+        assert len(token) == 64  # 32-byte digest is 64 hex chars
         assert all(c in "0123456789abcdef" for c in token)
 
+    def test_session_digest_matches_token(self):
+        """session_digest returns the raw bytes behind the hex token."""
+        digest = session_digest("test-api-key")
+
+        assert len(digest) == 32
+        assert digest.hex() == generate_session_token("test-api-key")
+
     def test_generate_session_token_deterministic(self):
         """generate_session_token returns same token for same key."""
         api_key = "test-api-key"
@@ -38,6 +54,15 @@ class TestSessionToken:
 
         assert token1 != token2
 
+    def test_generate_session_token_distinguishes_long_keys(self):
+        """Keys longer than the BLAKE2b key limit still produce distinct tokens."""
+        prefix = "k" * 64
+
+        token1 = generate_session_token(prefix + "1")
+        token2 = generate_session_token(prefix + "2")
+
+        assert token1 != token2
+
     def test_verify_session_token_valid(self):
         """verify_session_token returns True for valid token."""
         api_key = "test-api-key"
@@ -70,6 +95,31 @@ class TestSessionToken:
         assert result is False
 
 
+class TestExtractSessionToken:
+    """Tests for raw Cookie header scanning."""
+
+    def test_extracts_single_cookie(self):
+        """Token is extracted when session cookie is the only one."""
+        assert extract_session_token(b"euler_session=abc123") == b"abc123"
+
+    def test_extracts_among_other_cookies(self):
+        """Token is extracted from the middle of the header."""
+        header = b"theme=dark; euler_session=abc123; lang=ru"
+
+        assert extract_session_token(header) == b"abc123"
+
+    def test_returns_none_when_absent(self):
+        """None is returned when session cookie is missing."""
+        assert extract_session_token(b"theme=dark") is None
+        assert extract_session_token(b"") is None
+
+    def test_ignores_cookie_with_suffix_name(self):
+        """Cookie whose name only ends with session name is not matched."""
+        header = b"xeuler_session=forged; euler_session=real"
+
+        assert extract_session_token(header) == b"real"
+
+
 class TestCookieAuthMiddlewarePaths:
     """Tests for CookieAuthMiddleware path classification."""
 
@@ -97,6 +147,122 @@ class TestCookieAuthMiddlewarePaths:
         finally:
             CookieAuthMiddleware.PROTECTED_PREFIXES = original
 
+    def test_requires_cookie_auth_with_empty_configuration(self):
+        """No path requires cookie auth when nothing is configured."""
+        original_paths = CookieAuthMiddleware.PROTECTED_PATHS
+        original_prefixes = CookieAuthMiddleware.PROTECTED_PREFIXES
+        try:
+            CookieAuthMiddleware.PROTECTED_PATHS = frozenset()
+            CookieAuthMiddleware.PROTECTED_PREFIXES = ()
+            assert CookieAuthMiddleware.requires_cookie_auth("/") is False
+            assert CookieAuthMiddleware.requires_cookie_auth("/admin") is False
+        finally:
+            CookieAuthMiddleware.PROTECTED_PATHS = original_paths
+            CookieAuthMiddleware.PROTECTED_PREFIXES = original_prefixes
+
+
+class TestDecodeSessionToken:
+    """Tests for hex session token decoding."""
+
+    def test_decodes_hex_token(self):
+        """Hex token decodes to the raw session digest."""
+        token = generate_session_token("test-api-key").encode()
+
+        assert decode_session_token(token) == session_digest("test-api-key")
+
+    def test_rejects_missing_or_invalid_token(self):
+        """Absent, empty, odd-length and non-hex tokens are rejected."""
+        assert decode_session_token(None) is None
+        assert decode_session_token(b"") is None
+        assert decode_session_token(b"abc") is None
+        assert decode_session_token(b"not-hex!") is None
+
+
+class TestCookieAuthMiddlewareRequests:
+    """Tests for CookieAuthMiddleware request handling."""
+
+    @staticmethod
+    def _create_client() -> TestClient:
+        """Create client for minimal app wrapped with CookieAuthMiddleware."""
+        app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+
+        @app.get("/{path:path}")
+        async def catch_all(path: str) -> PlainTextResponse:
+            return PlainTextResponse(path)
+
+        app.add_middleware(CookieAuthMiddleware)
+        return TestClient(app, follow_redirects=False)
+
+    def test_protected_path_redirects_without_cookie(self, settings):
+        """Protected path without session cookie redirects to login."""
+        response = self._create_client().get("/docs")
+
+        assert response.status_code == status.HTTP_302_FOUND
+        assert response.headers["location"] == "/login?next=%2Fdocs"
+        assert response.headers["cache-control"] == "no-store"
+
+    def test_redirect_escapes_path_characters(self, settings):
+        """Reserved characters in the path are escaped in the next parameter."""
+        response = self._create_client().get("/admin/a b&c")
+
+        assert response.headers["location"] == "/login?next=%2Fadmin%2Fa%20b%26c"
+
+    def test_public_path_passes_through_without_cookie(self, settings):
+        """Public path reaches the app without any session cookie."""
+        response = self._create_client().get("/login")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.text == "login"
+
+    def test_percent_encoded_protected_path_redirects(self, settings):
+        """Percent-encoded protected path is matched on the decoded path."""
+        response = self._create_client().get("/doc%73")
+
+        assert response.status_code == status.HTTP_302_FOUND
+
+    def test_protected_path_redirects_with_non_hex_cookie(self, settings):
+        """Malformed session cookie is rejected instead of raising."""
+        client = self._create_client()
+        client.cookies.set(COOKIE_NAME, "not-a-hex-token")
+
+        response = client.get("/docs")
+
+        assert response.status_code == status.HTTP_302_FOUND
+
+    def test_protected_path_allowed_with_valid_cookie(self, settings):
+        """Protected path with valid session cookie reaches the app."""
+        client = self._create_client()
+        client.cookies.set(COOKIE_NAME, generate_session_token(settings.api_key))
+
+        response = client.get("/docs")
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_middleware_matches_requires_cookie_auth(self, settings):
+        """Inline path classification agrees with requires_cookie_auth."""
+        client = self._create_client()
+        paths = ["/", "/login", "/docs", "/redoc", "/openapi.json", "/admin"]
+        paths += ["/admin/documents", "/api/documents", "/docs/extra", "/health"]
+
+        for path in paths:
+            redirected = client.get(path).status_code == status.HTTP_302_FOUND
+            assert redirected is CookieAuthMiddleware.requires_cookie_auth(path)
+
+    def test_session_token_computed_once_per_middleware(self, settings):
+        """Expected session token is not recomputed for each request."""
+        token = generate_session_token(settings.api_key)
+        client = self._create_client()
+        client.cookies.set(COOKIE_NAME, token)
+
+        with patch(
+            "app.middleware.cookie_auth.generate_session_token",
+            wraps=generate_session_token,
+        ) as generate:
+            for _ in range(3):
+                assert client.get("/docs").status_code == status.HTTP_200_OK
+
+        assert generate.call_count <= 1
+
 
 class TestCookieConstants:
     """Tests for cookie auth constants."""
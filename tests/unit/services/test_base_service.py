@@ -0,0 +1,536 @@
+"""Unit tests for BaseService query building."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import selectinload
+
+from app.exceptions import (
+    DatabaseConnectionError,
+    InvalidFilterError,
+    RecordNotFoundError,
+)
+from app.models.document import Document, DocumentStatus
+from app.models.document_chunk import DocumentChunk
+from app.services.base import BaseService
+
+
+class DocumentBaseService(BaseService[Document]):
+    """BaseService bound to Document for tests."""
+
+    model = Document
+
+
+class ChunkBaseService(BaseService[DocumentChunk]):
+    """BaseService bound to DocumentChunk for tests."""
+
+    model = DocumentChunk
+
+
+@pytest.fixture
+def mock_db() -> AsyncMock:
+    """Create mock async session returning an empty result."""
+    db = AsyncMock()
+    db.add = MagicMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = []
+    result.scalar_one.return_value = 0
+    db.execute.return_value = result
+    return db
+
+
+class TestFind:
+    """Tests for filtered find queries."""
+
+    @pytest.mark.asyncio
+    async def test_find_rejects_unmapped_filter_without_query(self, mock_db):
+        """find raises InvalidFilterError before touching the database."""
+        service = DocumentBaseService(mock_db)
+
+        with pytest.raises(InvalidFilterError, match="to_dict"):
+            await service.find(to_dict="value")
+
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_filters_by_mapped_columns(self, mock_db):
+        """find builds a WHERE clause for each filter."""
+        service = DocumentBaseService(mock_db)
+
+        await service.find(status=DocumentStatus.READY, filename="a.pdf")
+
+        query, params = mock_db.execute.call_args.args
+        assert "documents.status = :status" in str(query)
+        assert "documents.filename = :filename" in str(query)
+        assert params == {"status": DocumentStatus.READY, "filename": "a.pdf"}
+
+    @pytest.mark.asyncio
+    async def test_find_returns_result_list_without_copy(self, mock_db):
+        """find hands back the list built by the result instead of copying it."""
+        documents = [Document(filename="a.pdf")]
+        mock_db.execute.return_value.scalars.return_value.all.return_value = documents
+
+        assert await DocumentBaseService(mock_db).find() is documents
+
+    @pytest.mark.asyncio
+    async def test_find_reuses_statement_for_same_filter_shape(self, mock_db):
+        """Calls differing only in filter values share one statement."""
+        service = DocumentBaseService(mock_db)
+
+        await service.find(status=DocumentStatus.READY, limit=10)
+        first = mock_db.execute.call_args.args[0]
+        await service.find(status=DocumentStatus.ERROR, limit=20)
+        second, params = mock_db.execute.call_args.args
+
+        assert second is first
+        assert params == {"status": DocumentStatus.ERROR, "_limit": 20}
+
+    @pytest.mark.asyncio
+    async def test_find_keyword_order_does_not_change_results(self, mock_db):
+        """Filters in a different keyword order build an equivalent statement."""
+        service = DocumentBaseService(mock_db)
+
+        await service.find(status=DocumentStatus.READY, filename="a.pdf")
+        first, first_params = mock_db.execute.call_args.args
+        await service.find(filename="a.pdf", status=DocumentStatus.READY)
+        second, second_params = mock_db.execute.call_args.args
+
+        for name in ("status", "filename"):
+            assert f"documents.{name} = :{name}" in str(first)
+            assert f"documents.{name} = :{name}" in str(second)
+        assert first_params == second_params
+
+    @pytest.mark.asyncio
+    async def test_find_by_relationship_falls_back_to_filter_by(self, mock_db):
+        """Relationship filters are built per call with the related instance."""
+        document = Document(id=3, filename="a.pdf", s3_key="documents/a.pdf")
+
+        await ChunkBaseService(mock_db).find(document=document)
+
+        query, params = mock_db.execute.call_args.args
+        assert ":param_1 = document_chunks.document_id" in str(query)
+        assert params == {}
+
+
+class TestFindRows:
+    """Tests for column-only row queries."""
+
+    @pytest.mark.asyncio
+    async def test_find_rows_selects_columns_without_entities(self, mock_db):
+        """find_rows selects table columns and returns rows as is."""
+        rows = [MagicMock()]
+        mock_db.execute.return_value.all.return_value = rows
+        service = DocumentBaseService(mock_db)
+
+        result = await service.find_rows(
+            "id", "status", status=DocumentStatus.READY, error=None, limit=5
+        )
+
+        query = mock_db.execute.call_args.args[0]
+        sql = str(query)
+        assert sql.startswith("SELECT documents.id, documents.status \nFROM documents")
+        assert "documents.status = :status_1" in sql
+        assert "documents.error IS NULL" in sql
+        assert "LIMIT" in sql
+        assert "entity" not in query.column_descriptions[0]
+        assert result == rows
+
+    @pytest.mark.asyncio
+    async def test_find_rows_rejects_relationships(self, mock_db):
+        """Only columns can be selected or filtered as rows."""
+        with pytest.raises(InvalidFilterError, match="document"):
+            await ChunkBaseService(mock_db).find_rows(document=Document(id=1))
+
+        mock_db.execute.assert_not_called()
+
+
+class TestCountAndExists:
+    """Tests for count and exists queries."""
+
+    @pytest.mark.asyncio
+    async def test_count_rejects_unmapped_filter_without_query(self, mock_db):
+        """count raises InvalidFilterError before touching the database."""
+        service = DocumentBaseService(mock_db)
+
+        with pytest.raises(InvalidFilterError):
+            await service.count(missing="value")
+
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_count_none_filter_compiles_to_is_null(self, mock_db):
+        """None filter values match NULL like filter_by does."""
+        service = DocumentBaseService(mock_db)
+
+        await service.count(error=None)
+
+        query, params = mock_db.execute.call_args.args
+        assert "documents.error IS NULL" in str(query)
+        assert params == {}
+
+    @pytest.mark.asyncio
+    async def test_exists_selects_exists_subquery(self, mock_db):
+        """exists wraps the filtered select in EXISTS instead of counting."""
+        mock_db.execute.return_value.scalar_one.return_value = True
+        service = DocumentBaseService(mock_db)
+
+        assert await service.exists(status=DocumentStatus.READY) is True
+
+        query, params = mock_db.execute.call_args.args
+        sql = str(query)
+        assert sql.startswith("SELECT EXISTS (SELECT")
+        assert "count" not in sql
+        assert "documents.status = :status" in sql
+        assert params == {"status": DocumentStatus.READY}
+
+
+class TestServiceClass:
+    """Tests for per-class model bindings."""
+
+    def test_model_name_bound_per_service_class(self):
+        """Each service class caches its model's name for logs and errors."""
+        assert DocumentBaseService._model_name == "Document"
+        assert ChunkBaseService._model_name == "DocumentChunk"
+
+    def test_mapped_keys_include_relationships(self):
+        """Relationship attributes are accepted as filters."""
+        keys = DocumentChunk.mapped_keys()
+
+        assert "document" in keys
+        assert "document_id" in keys
+        assert "to_dict" not in keys
+
+    def test_statement_skeletons_built_per_service_class(self):
+        """Each service class gets insert and update statements for its model."""
+        assert DocumentBaseService._insert_returning.table.name == "documents"
+        assert ChunkBaseService._insert_returning.table.name == "document_chunks"
+        assert ChunkBaseService._update_by_pk.table.name == "document_chunks"
+
+
+class TestGet:
+    """Tests for primary key and paginated reads."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_uses_session_get(self, mock_db):
+        """get_by_id goes through the identity map via session.get."""
+        document = Document(filename="a.pdf")
+        mock_db.get.return_value = document
+        service = DocumentBaseService(mock_db)
+
+        assert await service.get_by_id(42) is document
+
+        mock_db.get.assert_awaited_once_with(Document, 42)
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_all_applies_pagination(self, mock_db):
+        """get_all adds offset and limit only when provided."""
+        service = DocumentBaseService(mock_db)
+
+        await service.get_all()
+        unpaginated = str(mock_db.execute.call_args.args[0])
+        await service.get_all(limit=10, offset=20)
+        paginated = mock_db.execute.call_args.args[0].compile()
+
+        assert "LIMIT" not in unpaginated
+        assert "LIMIT" in str(paginated) and "OFFSET" in str(paginated)
+        assert sorted(paginated.params.values()) == [10, 20]
+
+    @pytest.mark.asyncio
+    async def test_read_methods_apply_load_options(self, mock_db):
+        """Default and per-call loader options reach get_by_id, get_all and find."""
+
+        class EagerChunkService(ChunkBaseService):
+            default_load_options = (selectinload(DocumentChunk.document),)
+
+        service = EagerChunkService(mock_db)
+        loads = (selectinload(DocumentChunk.start_line),)
+
+        await service.get_by_id(7, loads=loads)
+        await service.get_all(limit=10, loads=loads)
+        await service.find(document_id=3, loads=loads)
+
+        mock_db.get.assert_not_called()
+        for call in mock_db.execute.call_args_list:
+            statement = call.args[0]
+            if hasattr(statement, "_resolved"):
+                statement = statement._resolved
+            loaded = [option.path[1].key for option in statement._with_options]
+            assert loaded == ["document", "start_line"]
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_with_relations_selectin_loads_relationships(self, mock_db):
+        """Every relationship of the model is eager-loaded with selectinload."""
+        await ChunkBaseService(mock_db).get_by_id_with_relations(7)
+
+        statement = mock_db.execute.call_args.args[0]
+        loaded = {option.path[1].key for option in statement._with_options}
+        assert loaded == {"document", "start_line", "end_line"}
+        assert "document_chunks.id = :id_1" in str(statement)
+
+
+class TestIterAll:
+    """Tests for streamed reads."""
+
+    @pytest.mark.asyncio
+    async def test_iter_all_streams_with_yield_per(self, mock_db):
+        """iter_all yields streamed rows using the requested batch size."""
+        documents = [Document(filename="a.pdf"), Document(filename="b.pdf")]
+
+        class _Stream:
+            def __aiter__(self):
+                return self._iterate()
+
+            async def _iterate(self):
+                for document in documents:
+                    yield document
+
+        mock_db.stream_scalars.return_value = _Stream()
+        service = DocumentBaseService(mock_db)
+
+        streamed = [document async for document in service.iter_all(batch_size=10)]
+
+        assert streamed == documents
+        statement = mock_db.stream_scalars.call_args.args[0]
+        assert statement.get_execution_options()["yield_per"] == 10
+        assert "LIMIT" not in str(statement)
+
+    @pytest.mark.asyncio
+    async def test_iter_all_applies_pagination(self, mock_db):
+        """iter_all pages the streamed query when limit and offset are given."""
+
+        class _Empty:
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                raise StopAsyncIteration
+
+        mock_db.stream_scalars.return_value = _Empty()
+        service = DocumentBaseService(mock_db)
+
+        assert [d async for d in service.iter_all(limit=5, offset=10)] == []
+
+        compiled = mock_db.stream_scalars.call_args.args[0].compile()
+        assert "LIMIT" in str(compiled) and "OFFSET" in str(compiled)
+        assert sorted(compiled.params.values()) == [5, 10]
+
+
+class TestCreateMany:
+    """Tests for bulk inserts."""
+
+    @pytest.mark.asyncio
+    async def test_create_many_issues_single_statement(self, mock_db):
+        """create_many inserts all rows with one RETURNING statement."""
+        created = [Document(filename="a.pdf"), Document(filename="b.pdf")]
+        mock_db.scalars.return_value = MagicMock(all=MagicMock(return_value=created))
+        service = DocumentBaseService(mock_db)
+        rows = [
+            {"filename": "a.pdf", "s3_key": "documents/a.pdf"},
+            {"filename": "b.pdf", "s3_key": "documents/b.pdf"},
+        ]
+
+        result = await service.create_many(rows)
+
+        assert result == created
+        mock_db.scalars.assert_awaited_once()
+        statement, params = mock_db.scalars.call_args.args
+        assert statement is DocumentBaseService._insert_returning
+        assert "RETURNING" in str(statement)
+        assert params == rows
+
+    @pytest.mark.asyncio
+    async def test_create_many_skips_query_for_empty_rows(self, mock_db):
+        """create_many returns empty list without querying."""
+        service = DocumentBaseService(mock_db)
+
+        assert await service.create_many([]) == []
+
+        mock_db.scalars.assert_not_called()
+
+
+class TestUpdate:
+    """Tests for single-record updates."""
+
+    @pytest.mark.asyncio
+    async def test_update_rejects_unmapped_attribute_without_query(self, mock_db):
+        """update raises InvalidFilterError before loading the record."""
+        service = DocumentBaseService(mock_db)
+
+        with pytest.raises(InvalidFilterError, match="is_ready"):
+            await service.update(1, status=DocumentStatus.READY, is_ready=True)
+
+        mock_db.execute.assert_not_called()
+        mock_db.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_update_issues_single_returning_statement(self, mock_db):
+        """Column updates run as one UPDATE ... RETURNING without a SELECT."""
+        updated = Document(filename="b.pdf")
+        mock_db.scalar.return_value = updated
+        service = DocumentBaseService(mock_db)
+
+        result = await service.update(4, filename="b.pdf")
+
+        assert result is updated
+        mock_db.execute.assert_not_called()
+        mock_db.refresh.assert_not_called()
+        statement = mock_db.scalar.call_args.args[0]
+        compiled = str(statement)
+        assert compiled.startswith("UPDATE documents SET filename=:filename")
+        assert "WHERE documents.id = :id_1 RETURNING" in compiled
+        options = mock_db.scalar.call_args.kwargs["execution_options"]
+        assert options == {"populate_existing": True}
+
+    @pytest.mark.asyncio
+    async def test_update_missing_record_raises_and_rolls_back(self, mock_db):
+        """UPDATE matching no row raises RecordNotFoundError."""
+        mock_db.scalar.return_value = None
+        service = DocumentBaseService(mock_db)
+
+        with pytest.raises(RecordNotFoundError):
+            await service.update(404, filename="b.pdf")
+
+        mock_db.rollback.assert_awaited_once()
+
+
+class TestUpdateMany:
+    """Tests for bulk updates by primary key."""
+
+    @pytest.mark.asyncio
+    async def test_update_many_issues_single_executemany(self, mock_db):
+        """update_many sends all rows with one bulk UPDATE by primary key."""
+        service = DocumentBaseService(mock_db)
+        rows = [
+            {"id": 1, "status": DocumentStatus.READY},
+            {"id": 2, "status": DocumentStatus.ERROR},
+        ]
+
+        await service.update_many(rows)
+
+        mock_db.execute.assert_awaited_once()
+        statement, params = mock_db.execute.call_args.args
+        assert str(statement).startswith("UPDATE documents")
+        assert params == rows
+
+    @pytest.mark.asyncio
+    async def test_update_many_rejects_rows_without_id(self, mock_db):
+        """Rows must carry the primary key."""
+        service = DocumentBaseService(mock_db)
+
+        with pytest.raises(InvalidFilterError, match="'id'"):
+            await service.update_many([{"status": DocumentStatus.READY}])
+
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_many_skips_query_for_empty_rows(self, mock_db):
+        """update_many does nothing for an empty batch."""
+        await DocumentBaseService(mock_db).update_many([])
+
+        mock_db.execute.assert_not_called()
+
+
+class TestDelete:
+    """Tests for deletes by primary key."""
+
+    @pytest.mark.asyncio
+    async def test_delete_issues_single_returning_statement(self, mock_db):
+        """delete runs one DELETE ... RETURNING without loading the record."""
+        mock_db.scalar.return_value = 4
+        service = DocumentBaseService(mock_db)
+
+        await service.delete(4)
+
+        mock_db.get.assert_not_called()
+        statement = str(mock_db.scalar.call_args.args[0])
+        assert statement.startswith("DELETE FROM documents WHERE documents.id = :id_1")
+        assert statement.endswith("RETURNING documents.id")
+
+    @pytest.mark.asyncio
+    async def test_delete_missing_record_raises(self, mock_db):
+        """DELETE matching no row raises RecordNotFoundError."""
+        mock_db.scalar.return_value = None
+        service = DocumentBaseService(mock_db)
+
+        with pytest.raises(RecordNotFoundError):
+            await service.delete(404)
+
+        mock_db.rollback.assert_awaited_once()
+
+
+class TestErrorHandling:
+    """Tests for database error wrapping."""
+
+    @pytest.mark.asyncio
+    async def test_write_error_rolls_back_and_wraps(self, mock_db):
+        """Write failures roll back and surface as DatabaseConnectionError."""
+        mock_db.flush.side_effect = SQLAlchemyError("boom")
+        service = DocumentBaseService(mock_db)
+
+        with pytest.raises(DatabaseConnectionError, match="during create: boom"):
+            await service.create(filename="a.pdf", s3_key="documents/a.pdf")
+
+        mock_db.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_read_error_wraps_without_rollback(self, mock_db):
+        """Read failures surface as DatabaseConnectionError without rollback."""
+        mock_db.execute.side_effect = SQLAlchemyError("boom")
+        service = DocumentBaseService(mock_db)
+
+        with pytest.raises(DatabaseConnectionError, match="during count: boom"):
+            await service.count()
+
+        mock_db.rollback.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_error_log_skipped_when_error_level_disabled(
+        self, mock_db, monkeypatch
+    ):
+        """Disabled error logging skips the record but still raises."""
+        from app.services import base
+
+        mock_logger = MagicMock()
+        mock_logger.isEnabledFor.return_value = False
+        monkeypatch.setattr(base, "logger", mock_logger)
+        mock_db.execute.side_effect = SQLAlchemyError("boom")
+
+        with pytest.raises(DatabaseConnectionError, match="during count: boom"):
+            await DocumentBaseService(mock_db).count()
+
+        mock_logger.error.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_error_log_includes_record_id(self, mock_db, caplog):
+        """Failures of methods taking a record ID log that ID."""
+        mock_db.scalar.side_effect = SQLAlchemyError("boom")
+
+        with pytest.raises(DatabaseConnectionError):
+            await DocumentBaseService(mock_db).update(4, filename="b.pdf")
+
+        record = caplog.records[-1]
+        assert record.getMessage() == "Database error during update on Document"
+        assert record.id == 4
+
+    @pytest.mark.asyncio
+    async def test_error_log_includes_filters(self, mock_db, caplog):
+        """Failures of filtered reads log the filters without pagination."""
+        mock_db.execute.side_effect = SQLAlchemyError("boom")
+
+        with pytest.raises(DatabaseConnectionError):
+            await DocumentBaseService(mock_db).find(
+                limit=5, status=DocumentStatus.READY
+            )
+
+        assert caplog.records[-1].filters == {"status": DocumentStatus.READY}
+
+    @pytest.mark.asyncio
+    async def test_integrity_error_reported_as_constraint_violation(self, mock_db):
+        """IntegrityError is reported as a constraint violation."""
+        mock_db.flush.side_effect = IntegrityError("INSERT", {}, Exception("dup"))
+        service = DocumentBaseService(mock_db)
+
+        with pytest.raises(DatabaseConnectionError, match="Integrity constraint"):
+            await service.create(filename="a.pdf", s3_key="documents/a.pdf")
@@ -157,6 +157,35 @@ class TestBlockDetection:
         # Should detect as theorem even without \begin{theorem}
         assert any(b.block_type == BlockType.THEOREM for b in blocks)
 
+    def test_environment_tags_match_case_insensitively(
+        self, chunking_service: ChunkingService
+    ):
+        """Begin and end tags close the block regardless of case."""
+        lines = [
+            self._create_line(1, 1, "\\begin{Theorem}"),
+            self._create_line(1, 2, "If $f$ is continuous, then..."),
+            self._create_line(1, 3, "\\END{theorem}"),
+            self._create_line(1, 4, "After the theorem"),
+        ]
+
+        blocks = chunking_service._parse_blocks(lines)
+
+        assert [block.block_type for block in blocks] == [
+            BlockType.THEOREM,
+            BlockType.NARRATIVE,
+        ]
+        assert blocks[0].end_line_id == 3
+
+    def test_russian_keyword_detected_anywhere_in_line(
+        self, chunking_service: ChunkingService
+    ):
+        """Keyword lookup is not limited to the start of the line."""
+        detect = chunking_service._detect_russian_keyword
+
+        assert detect("Отсюда получаем Следствие 2.") == BlockType.COROLLARY
+        assert detect("\\textbf{Примечание}. См. выше") == BlockType.REMARK
+        assert detect("Обычный текст без ключевых слов") is None
+
     def test_preserves_line_references(self, chunking_service: ChunkingService):
         """Service preserves start and end line IDs."""
         lines = [
@@ -510,6 +539,37 @@ class TestContextHeaders:
             "Theorem"
         )
 
+    def test_uses_last_three_definitions(self, chunking_service: ChunkingService):
+        """Only the three most recent definitions are prepended, in order."""
+        blocks = [
+            Block(
+                block_type=BlockType.DEFINITION,
+                text=f"Definition {i}",
+                start_line_id=i,
+                end_line_id=i,
+                start_page=1,
+                end_page=1,
+            )
+            for i in range(1, 6)
+        ]
+        blocks.append(
+            Block(
+                block_type=BlockType.THEOREM,
+                text="Theorem",
+                start_line_id=6,
+                end_line_id=6,
+                start_page=1,
+                end_page=1,
+            )
+        )
+
+        theorem = chunking_service._add_context_headers(blocks)[-1]
+
+        assert theorem.text == (
+            "Context:\nDefinition 3\n\nDefinition 4\n\nDefinition 5"
+            "\n\n---\n\nTheorem"
+        )
+
     def test_limits_context_header_size(self, chunking_service: ChunkingService):
         """Service limits context header to prevent bloat."""
         # Create many definitions
@@ -575,6 +635,45 @@ class TestTokenCounting:
         # Should count Russian words
         assert count > 5
 
+    def test_counts_special_token_markup_as_text(
+        self, chunking_service: ChunkingService
+    ):
+        """Special token markup in OCR text is counted, not rejected."""
+        count = chunking_service._count_tokens("Конец <|endoftext|> текста")
+
+        assert count > 3
+
+    def test_block_tokens_encodes_each_block_once(
+        self, chunking_service: ChunkingService
+    ):
+        """A definition reused by several theorems is encoded only once."""
+        definition = Block(
+            block_type=BlockType.DEFINITION,
+            text="Definition: A metric space is...",
+            start_line_id=1,
+            end_line_id=1,
+            start_page=1,
+            end_page=1,
+        )
+        theorems = [
+            Block(
+                block_type=BlockType.THEOREM,
+                text=f"Theorem {i}",
+                start_line_id=i,
+                end_line_id=i,
+                start_page=1,
+                end_page=1,
+            )
+            for i in range(2, 5)
+        ]
+        encode = Mock(wraps=chunking_service._encoder.encode_ordinary)
+        chunking_service._encoder = Mock(encode_ordinary=encode)
+
+        chunking_service._add_context_headers([definition, *theorems])
+
+        assert encode.call_count == 1
+        assert definition.token_count == chunking_service._count_tokens(definition.text)
+
 
 class TestFullChunkingWorkflow:
     """Tests for complete chunking workflow."""
@@ -0,0 +1,54 @@
+"""Unit tests for DocumentChunkService similarity search."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.document_chunk_service import DocumentChunkService
+
+
+@pytest.fixture
+def mock_db() -> AsyncMock:
+    """Create mock async session returning an empty result."""
+    db = AsyncMock()
+    db.execute.return_value = MagicMock()
+    return db
+
+
+def _compiled_query(mock_db: AsyncMock) -> str:
+    """Compile the executed statement for PostgreSQL."""
+    statement = mock_db.execute.call_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_search_similar_uses_hamming_candidates_then_cosine(mock_db):
+    """Candidates come from binary-quantized Hamming distance, order by cosine."""
+    service = DocumentChunkService(mock_db)
+
+    await service.search_similar([0.5] * 1024, limit=5)
+
+    query = _compiled_query(mock_db)
+    candidate_order = (
+        "CAST(binary_quantize(document_chunks.embedding) AS BIT(1024)) <~> "
+        "CAST(binary_quantize(CAST(%(query_embedding)s AS halfvec(1024))) "
+        "AS BIT(1024))"
+    )
+    assert candidate_order in query
+    assert (
+        "ORDER BY document_chunks.embedding <=> "
+        "CAST(%(query_embedding)s AS halfvec(1024))"
+    ) in query
+
+
+@pytest.mark.asyncio
+async def test_search_similar_rescoring_pool_covers_limit(mock_db):
+    """Candidate pool is never smaller than the requested limit."""
+    service = DocumentChunkService(mock_db)
+
+    await service.search_similar([0.5] * 1024, limit=50, candidates=10)
+
+    params = mock_db.execute.call_args.args[0].compile().params
+    assert params["param_1"] == 50
+    assert params["param_2"] == 50
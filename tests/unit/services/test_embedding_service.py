@@ -97,7 +97,6 @@ async def test_generate_embeddings_batch_splits_large_batches(embedding_settings
 
     Verifies the service splits 100 texts into 2 batches of 50.
     """
-    embedding_settings.embedding_batch_size = 50
     texts = [f"text {i}" for i in range(100)]
 
     Mock()
@@ -0,0 +1,37 @@
+"""Unit tests for SolveRequestService queries."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.models.solve_request import SolveRequest
+from app.services.solve_request_service import SolveRequestService
+
+
+@pytest.mark.asyncio
+async def test_find_by_chunk_uses_containment():
+    """find_by_chunk filters chunks_used with @> so the GIN index applies."""
+    db = AsyncMock()
+    db.execute.return_value = MagicMock()
+
+    await SolveRequestService(db).find_by_chunk("abc")
+
+    statement = db.execute.call_args.args[0]
+    compiled = statement.compile(dialect=postgresql.dialect())
+    assert "solve_requests.chunks_used @> %(chunks_used_1)s" in str(compiled)
+    assert compiled.params["chunks_used_1"] == [{"chunk_id": "abc"}]
+
+
+def test_chunks_used_gin_index_uses_jsonb_path_ops():
+    """chunks_used is indexed with GIN jsonb_path_ops."""
+    (index,) = (
+        index
+        for index in SolveRequest.__table__.indexes
+        if index.name == "ix_solve_requests_chunks_used_gin"
+    )
+
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+    assert "USING gin (chunks_used jsonb_path_ops)" in ddl
@@ -1,6 +1,11 @@
 """Unit tests for application factory."""
 
-from app.application import create_app
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.application import _setup_cors, create_app
 
 
 class TestApplication:
@@ -16,3 +21,25 @@ class TestApplication:
         # API routes (protected)
         assert "/api/health" in routes
         assert "/api/documents" in routes
+
+
+class TestCorsSetup:
+    """Tests for CORS middleware configuration."""
+
+    def test_production_without_origins_skips_middleware(self):
+        """CORS middleware is not added when no origins are configured."""
+        app = FastAPI()
+        settings = MagicMock(is_development=False, cors_origins=[])
+
+        _setup_cors(app, settings)
+
+        assert all(m.cls is not CORSMiddleware for m in app.user_middleware)
+
+    def test_production_with_origins_adds_middleware(self):
+        """CORS middleware is added when origins are configured."""
+        app = FastAPI()
+        settings = MagicMock(is_development=False, cors_origins=["https://example.com"])
+
+        _setup_cors(app, settings)
+
+        assert any(m.cls is CORSMiddleware for m in app.user_middleware)
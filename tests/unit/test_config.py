@@ -78,6 +78,30 @@ class TestSettings:
             for error in errors
         )
 
+    def test_production_reports_all_security_errors(self, monkeypatch):
+        """Missing password and short API key are reported together."""
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        monkeypatch.setenv("DB_PASSWORD", "")
+        monkeypatch.setenv("API_KEY", "short-key")
+
+        with pytest.raises(ValidationError) as exc_info:
+            Settings()
+
+        locations = {error["loc"] for error in exc_info.value.errors()}
+        assert locations == {("db_password",), ("api_key",)}
+
+    def test_production_requires_password_when_not_provided(self, monkeypatch):
+        """Missing password is rejected even though defaults are not validated."""
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        monkeypatch.setenv("API_KEY", "a" * 32)
+        monkeypatch.delenv("DB_PASSWORD", raising=False)
+
+        with pytest.raises(ValidationError) as exc_info:
+            Settings(_env_file=None)
+
+        errors = exc_info.value.errors()
+        assert [error["loc"] for error in errors] == [("db_password",)]
+
     def test_api_key_must_not_be_empty(self, monkeypatch):
         """API key must not be empty."""
         monkeypatch.setenv("API_KEY", "")
@@ -88,6 +112,23 @@ class TestSettings:
         errors = exc_info.value.errors()
         assert any(error["loc"] == ("api_key",) for error in errors)
 
+    def test_api_key_required_when_not_provided(self, monkeypatch):
+        """Missing API key is rejected even though defaults are not validated."""
+        monkeypatch.delenv("API_KEY", raising=False)
+
+        with pytest.raises(ValidationError) as exc_info:
+            Settings(_env_file=None)
+
+        errors = exc_info.value.errors()
+        assert any(error["loc"] == ("api_key",) for error in errors)
+
+    def test_settings_are_frozen(self):
+        """Assigning to a loaded setting is rejected."""
+        settings = Settings()
+
+        with pytest.raises(ValidationError):
+            settings.port = 9000
+
     def test_get_settings_caches_result(self):
         """get_settings returns cached instance."""
         get_settings.cache_clear()
@@ -0,0 +1,112 @@
+"""Unit tests for model registration."""
+
+from app.models import BaseModel, Document, DocumentChunk, DocumentLine, SolveRequest
+from app.utils.db import Base
+
+
+def test_models_share_single_declarative_registry():
+    """All application models register into the one Base metadata."""
+    models = (Document, DocumentChunk, DocumentLine, SolveRequest)
+
+    assert issubclass(BaseModel, Base)
+    for model in models:
+        assert model.registry is Base.registry
+        assert model.__table__.metadata is Base.metadata
+        assert model.__table__.name in Base.metadata.tables
+
+
+def test_to_dict_maps_every_column_to_its_value():
+    """to_dict returns all columns in table order with instance values."""
+    document = Document(filename="notes.pdf", s3_key="documents/notes.pdf")
+
+    data = document.to_dict()
+
+    assert list(data) == [column.name for column in Document.__table__.columns]
+    assert data["filename"] == "notes.pdf"
+    assert data["s3_key"] == "documents/notes.pdf"
+    assert data["id"] is None
+
+
+def test_document_progress_default_is_fresh_per_row():
+    """Each inserted document gets its own progress dict."""
+    default = Document.__table__.c.progress.default
+
+    first = default.arg(None)
+    second = default.arg(None)
+
+    assert default.is_callable
+    assert first == second == {"page": 0, "total": 0}
+    assert first is not second
+
+
+def test_document_chunk_declares_hnsw_embedding_index():
+    """Embedding HNSW index is part of model metadata, not only migrations."""
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+
+    index = next(
+        index
+        for index in DocumentChunk.__table__.indexes
+        if index.name == "idx_chunk_embedding_cosine"
+    )
+
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    assert "USING hnsw (embedding halfvec_cosine_ops)" in ddl
+    assert "WITH (m = 16, ef_construction = 200)" in ddl
+
+
+def test_document_chunk_lookups_use_composite_unique_index():
+    """document_id and chunk_index rely on the composite unique index."""
+    indexed_columns = [
+        tuple(index.columns.keys()) for index in DocumentChunk.__table__.indexes
+    ]
+    unique_columns = [
+        tuple(constraint.columns.keys())
+        for constraint in DocumentChunk.__table__.constraints
+        if constraint.name == "uq_document_chunks_document_chunk_index"
+    ]
+
+    assert ("document_id",) not in indexed_columns
+    assert ("chunk_index",) not in indexed_columns
+    assert unique_columns == [("document_id", "chunk_index")]
+
+
+def test_relationships_raise_instead_of_lazy_loading():
+    """Unloaded relationships raise rather than emitting per-row queries."""
+    for model in (DocumentChunk, DocumentLine):
+        for relationship in model.__mapper__.relationships:
+            assert relationship.lazy == "raise_on_sql", relationship
+
+
+def test_document_chunk_embedding_is_half_precision():
+    """Embeddings are stored as halfvec with the configured dimensions."""
+    from sqlalchemy.dialects import postgresql
+
+    column_type = DocumentChunk.__table__.c.embedding.type
+
+    assert column_type.compile(dialect=postgresql.dialect()) == "halfvec(1024)"
+
+
+def test_line_and_chunk_repr_use_loaded_state_only():
+    """repr reads loaded values and tolerates attributes that are not set."""
+    line = DocumentLine(document_id=3, page_number=1, line_number=2, text="x" * 60)
+    chunk = DocumentChunk(document_id=3, chunk_index=0)
+
+    assert repr(line) == (
+        "DocumentLine(id=None, document_id=3, page=1, line=2, "
+        f"type=None, text={'x' * 50!r}...)"
+    )
+    assert repr(chunk) == (
+        "DocumentChunk(id=None, document_id=3, chunk_index=0, type=None, "
+        "pages=None-None, text=''...)"
+    )
+
+
+def test_column_keys_exclude_relationships_and_are_cached():
+    """column_keys lists column attributes only and is computed once."""
+    keys = DocumentChunk.column_keys()
+
+    assert "document_id" in keys
+    assert "document" not in keys
+    assert DocumentChunk.column_keys() is keys
+    assert DocumentLine.column_keys() != keys
@@ -1,6 +1,18 @@
 """Unit tests for vector type support."""
 
-from app.utils.vector_types import Vector
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+from app.exceptions import DatabaseConnectionError
+from app.utils.vector_types import (
+    HalfVector,
+    Vector,
+    _vector_decoder,
+    _vector_encoder,
+    set_vector_codecs,
+)
 
 
 class TestVectorType:
@@ -91,3 +103,80 @@ class TestVectorType:
 
         assert len(deserialized) == 1024
         assert deserialized == original
+
+
+class TestHalfVectorType:
+    """Test suite for pgvector HalfVector type."""
+
+    def test_get_col_spec(self):
+        """Test halfvec column specification generation."""
+        assert HalfVector(1024).get_col_spec() == "halfvec(1024)"
+
+    def test_round_trip_serialization(self):
+        """HalfVector shares the vector text format."""
+        vector_type = HalfVector(3)
+        bind_proc = vector_type.bind_processor(dialect=None)
+        result_proc = vector_type.result_processor(dialect=None, coltype=None)
+
+        assert bind_proc([0.5, -1.0, 2.0]) == "[0.5,-1.0,2.0]"
+        assert result_proc("[0.5,-1,2]") == [0.5, -1.0, 2.0]
+
+
+class TestBinaryCodecs:
+    """Test suite for asyncpg binary pgvector codecs."""
+
+    def test_vector_round_trip(self):
+        """float32 values survive encoding in pgvector binary format."""
+        data = _vector_encoder("f")([0.5, -1.25, 2.0])
+
+        assert data[:4] == b"\x00\x03\x00\x00"
+        assert len(data) == 4 + 3 * 4
+        assert _vector_decoder("f")(data) == [0.5, -1.25, 2.0]
+
+    def test_halfvec_uses_two_bytes_per_value(self):
+        """halfvec values are packed as float16."""
+        data = _vector_encoder("e")([0.5] * 1024)
+
+        assert len(data) == 4 + 1024 * 2
+        assert _vector_decoder("e")(data) == [0.5] * 1024
+
+    def test_asyncpg_dialect_skips_text_processing(self):
+        """With asyncpg the driver codec handles conversion."""
+        dialect = PGDialect_asyncpg()
+
+        assert HalfVector(3).bind_processor(dialect) is None
+        assert HalfVector(3).result_processor(dialect, coltype=None) is None
+
+    @pytest.mark.asyncio
+    async def test_set_vector_codecs_uses_extension_schema(self):
+        """Codecs are registered per type in the extension's schema."""
+        connection = AsyncMock()
+        connection.fetchval.return_value = "extensions"
+
+        await set_vector_codecs(connection)
+
+        calls = connection.set_type_codec.call_args_list
+        assert [c.args[0] for c in calls] == ["vector", "halfvec"]
+        assert all(c.kwargs["schema"] == "extensions" for c in calls)
+        assert all(c.kwargs["format"] == "binary" for c in calls)
+
+    @pytest.mark.asyncio
+    async def test_set_vector_codecs_requires_extension(self):
+        """Connecting without the extension fails instead of skipping codecs."""
+        connection = AsyncMock()
+        connection.fetchval.return_value = None
+
+        with pytest.raises(DatabaseConnectionError, match="not installed"):
+            await set_vector_codecs(connection)
+
+        connection.set_type_codec.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_set_vector_codecs_requires_every_type(self):
+        """A missing pgvector type fails the connection."""
+        connection = AsyncMock()
+        connection.fetchval.return_value = "public"
+        connection.set_type_codec.side_effect = [None, ValueError("unknown")]
+
+        with pytest.raises(DatabaseConnectionError, match="public.halfvec"):
+            await set_vector_codecs(connection)
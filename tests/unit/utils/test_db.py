@@ -5,7 +5,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from sqlalchemy.exc import OperationalError
 
-from app.utils.db import DatabaseManager, db_manager, get_db_session, init_db
+from app.utils.db import (
+    DatabaseManager,
+    db_manager,
+    get_db_session,
+    init_db,
+    parallel_reads,
+)
 
 
 class TestDatabaseManager:
@@ -65,6 +71,40 @@ class TestDatabaseManager:
             with pytest.raises(OperationalError):
                 await manager.verify_connection()
 
+    @pytest.mark.asyncio
+    async def test_warm_pool_holds_connections_until_all_open(self):
+        """warm_pool opens connections concurrently, then releases them."""
+        manager = DatabaseManager()
+        connections = [AsyncMock() for _ in range(3)]
+        for connection in connections:
+            connection.start.return_value = connection
+        mock_engine = MagicMock()
+        mock_engine.connect.side_effect = connections
+
+        with patch.object(manager, "init_engine", return_value=mock_engine):
+            await manager.warm_pool(3)
+
+        for connection in connections:
+            connection.start.assert_awaited_once()
+            connection.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_warm_pool_releases_opened_connections_on_failure(self):
+        """Connections that opened are returned before the error propagates."""
+        manager = DatabaseManager()
+        opened = AsyncMock()
+        opened.start.return_value = opened
+        failed = AsyncMock()
+        failed.start.side_effect = OperationalError("connection failed", None, None)
+        mock_engine = MagicMock()
+        mock_engine.connect.side_effect = [opened, failed]
+
+        with patch.object(manager, "init_engine", return_value=mock_engine):
+            with pytest.raises(OperationalError):
+                await manager.warm_pool(2)
+
+        opened.close.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_close_disposes_engine(self):
         """close disposes engine and clears state."""
@@ -144,14 +184,20 @@ class TestInitDb:
     @pytest.mark.asyncio
     async def test_success(self):
         """init_db succeeds when connection is verified."""
-        with patch(
-            "app.utils.db.db_manager.verify_connection", new_callable=AsyncMock
-        ) as mock_verify:
+        with (
+            patch(
+                "app.utils.db.db_manager.verify_connection", new_callable=AsyncMock
+            ) as mock_verify,
+            patch(
+                "app.utils.db.db_manager.warm_pool", new_callable=AsyncMock
+            ) as mock_warm,
+        ):
             mock_verify.return_value = True
 
             await init_db()
 
             mock_verify.assert_awaited_once()
+            mock_warm.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_raises_on_failure(self):
@@ -163,3 +209,41 @@ class TestInitDb:
 
             with pytest.raises(OperationalError):
                 await init_db()
+
+
+class TestParallelReads:
+    """Tests for parallel_reads helper."""
+
+    @pytest.mark.asyncio
+    async def test_runs_each_read_on_its_own_session(self):
+        """Reads overlap, each with a separate session, results in order."""
+        import asyncio
+
+        sessions = []
+        both_started = asyncio.Event()
+
+        class MockSessionContext:
+            async def __aenter__(self):
+                session = AsyncMock()
+                sessions.append(session)
+                return session
+
+            async def __aexit__(self, *args):
+                return None
+
+        async def read(session, value):
+            if len(sessions) == 2:
+                both_started.set()
+            # Blocks unless the other read runs concurrently
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return value, session
+
+        with patch("app.utils.db.db_manager.init_session_factory") as mock_factory:
+            mock_factory.return_value = MagicMock(side_effect=MockSessionContext)
+
+            results = await parallel_reads(
+                lambda db: read(db, "first"), lambda db: read(db, "second")
+            )
+
+        assert [value for value, _ in results] == ["first", "second"]
+        assert results[0][1] is not results[1][1]
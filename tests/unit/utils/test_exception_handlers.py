@@ -0,0 +1,69 @@
+"""Unit tests for exception handlers."""
+
+import json
+
+from fastapi import status
+
+from app.exceptions import (
+    DatabaseConnectionError,
+    InvalidFilterError,
+    RecordNotFoundError,
+)
+from app.utils.exception_handlers import (
+    configured_exception_handler,
+    generic_exception_handler,
+)
+
+
+class TestConfiguredExceptionHandler:
+    """Tests for configured exception handler responses."""
+
+    async def test_static_payload_for_database_error(self):
+        """Database errors return constant body without exception details."""
+        response = await configured_exception_handler(
+            None, DatabaseConnectionError("secret connection string")
+        )
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {
+            "error": "Service Unavailable",
+            "message": "Database connection error. Please try again later.",
+        }
+
+    async def test_detailed_payload_for_record_not_found(self):
+        """Not found errors include model name and record id."""
+        response = await configured_exception_handler(
+            None, RecordNotFoundError("Document", 42)
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert json.loads(response.body) == {
+            "error": "Not Found",
+            "message": "Document with id=42 not found",
+            "model": "Document",
+            "record_id": 42,
+        }
+
+    async def test_subclass_uses_closest_config(self):
+        """Exceptions without own config use the closest parent config."""
+        response = await configured_exception_handler(
+            None, InvalidFilterError("bad filter")
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert json.loads(response.body)["message"] == "bad filter"
+
+
+class TestGenericExceptionHandler:
+    """Tests for unhandled exception responses."""
+
+    async def test_returns_constant_500_body(self):
+        """Unhandled exceptions return generic 500 body."""
+        response = await generic_exception_handler(None, RuntimeError("boom"))
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert json.loads(response.body) == {
+            "error": "Internal Server Error",
+            "message": "An unexpected error occurred. Please try again later.",
+        }
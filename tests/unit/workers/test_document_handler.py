@@ -4,6 +4,7 @@ import io
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.document import Document, DocumentStatus
@@ -239,6 +240,35 @@ class TestDocumentHandlerProcess:
 
         assert "not found" in str(exc_info.value).lower()
 
+    @pytest.mark.asyncio
+    async def test_process_inserts_lines_in_one_statement(
+        self,
+        document_handler: DocumentHandler,
+        mock_session_factory,
+        sample_task: Task,
+        sample_document: Document,
+        mock_s3,
+    ):
+        """Lines are inserted with one executemany INSERT ... ON CONFLICT."""
+        mock_session = mock_session_factory.return_value
+        mock_session.get = AsyncMock(return_value=sample_document)
+        mock_session.flush = AsyncMock()
+        mock_session.execute = AsyncMock(
+            return_value=MagicMock(scalars=lambda: MagicMock(all=lambda: []))
+        )
+        mock_s3.download_file = MagicMock(return_value=self._create_simple_pdf(1))
+        mock_s3.get_file_url = MagicMock(return_value="https://s3.example.com/test.pdf")
+
+        await document_handler.process(sample_task, mock_session)
+
+        statement, rows = mock_session.execute.call_args_list[0].args
+        compiled = str(statement.compile(dialect=postgresql.dialect()))
+        assert compiled.startswith("INSERT INTO document_lines")
+        conflict = "ON CONFLICT ON CONSTRAINT uq_document_lines_document_page_line"
+        assert conflict in compiled
+        assert [row["text"] for row in rows] == ["Sample text line"]
+        assert rows[0]["line_number"] == 1
+
     def _create_simple_pdf(self, num_pages: int) -> bytes:
         """Create a simple PDF with specified number of pages for testing."""
         from pypdf import PdfWriter